@@ -0,0 +1,20 @@
+"""Internal helpers shared by the Symphony backend and room mapper."""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict
+
+__all__ = ("_coalesce",)
+
+
+async def _coalesce(inflight: Dict[Any, "asyncio.Future[Any]"], key: Any, fetch: Callable[[], Awaitable[Any]]) -> Any:
+    """Run ``fetch()`` once for concurrent callers asking for the same key.
+
+    The shared future is kept in ``inflight`` until it completes.
+    """
+    future = inflight.get(key)
+    if future is None:
+        future = asyncio.ensure_future(fetch())
+        inflight[key] = future
+        future.add_done_callback(lambda _: inflight.pop(key, None))
+    # Shield so one cancelled caller does not cancel the shared lookup
+    return await asyncio.shield(future)
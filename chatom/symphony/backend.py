@@ -9,8 +9,10 @@ import contextlib
 import importlib
 import logging
 import re
+import time
 from datetime import datetime, timedelta, timezone
-from typing import Any, AsyncIterator, ClassVar, List, Optional, Union
+from functools import partial
+from typing import Any, AsyncIterator, Callable, ClassVar, Dict, Iterable, List, Optional, Tuple, Union
 
 from pydantic import Field
 
@@ -29,11 +31,12 @@ from ..base import (
     User,
 )
 from ..format.variant import Format
-from .channel import SymphonyChannel, SymphonyStreamType
+from ._util import _coalesce
+from .channel import _STREAM_TYPE_LOOKUP, SymphonyChannel, _stream_channel_type
 from .config import SymphonyConfig
-from .mention import mention_user as _mention_user
+from .mention import mention_user as _mention_user, mention_user_by_uid
 from .message import SymphonyMessage
-from .presence import SymphonyPresence, SymphonyPresenceStatus
+from .presence import _STATUS_TO_BASE_STATUS, SymphonyPresence, SymphonyPresenceStatus
 from .user import SymphonyUser
 
 log = logging.getLogger(__name__)
@@ -57,6 +60,12 @@ except ImportError:
     _bdk_config_module = None
     _presence_service_module = None
     _symphony_bdk_module = None
+    # Stand-in base so the datafeed listener below can be defined without the BDK
+    RealTimeEventListener = object
+    UserIdList = None
+    UserSearchQuery = None
+    V2RoomSearchCriteria = None
+    V3RoomAttributes = None
 
 SymphonyBdk: Any = getattr(_symphony_bdk_module, "SymphonyBdk", None)
 BdkConfig: Any = getattr(_bdk_config_module, "BdkConfig", None)
@@ -84,6 +93,124 @@ PRESENCE_MAP = {
     "offline": "OFF_WORK",
 }
 
+# Map Symphony presence categories to our enum
+_CATEGORY_TO_STATUS = {
+    "AVAILABLE": SymphonyPresenceStatus.AVAILABLE,
+    "BUSY": SymphonyPresenceStatus.BUSY,
+    "AWAY": SymphonyPresenceStatus.AWAY,
+    "ON_THE_PHONE": SymphonyPresenceStatus.ON_THE_PHONE,
+    "BE_RIGHT_BACK": SymphonyPresenceStatus.BE_RIGHT_BACK,
+    "IN_A_MEETING": SymphonyPresenceStatus.IN_A_MEETING,
+    "OUT_OF_OFFICE": SymphonyPresenceStatus.OUT_OF_OFFICE,
+    "OFF_WORK": SymphonyPresenceStatus.OFF_WORK,
+    "OFFLINE": SymphonyPresenceStatus.OFFLINE,
+}
+_DEFAULT_STATUS = SymphonyPresenceStatus.OFFLINE
+
+# Keys probed, in order, on BDK user payloads (dicts or generated model objects)
+_USER_DISPLAY_NAME_KEYS = ("display_name", "displayName")
+# V2UserDetail has email in user_attributes.email_address
+_USER_EMAIL_PATHS = (
+    ("email_address",),
+    ("emailAddress",),
+    ("email",),
+    ("user_attributes", "email_address"),
+    ("user_attributes", "emailAddress"),
+)
+
+# Queue sentinel marking the end of a stream_messages datafeed
+_STREAM_END = object()
+# Most queued datafeed messages stream_messages takes per wakeup
+_STREAM_DRAIN_MAX = 64
+
+_MESSAGEML_PREFIX = re.compile(r"\s*<messageML>")
+
+
+def _needs_messageml_wrap(content: str) -> bool:
+    """Check whether content still needs an outer ``<messageML>`` wrapper.
+
+    Matches the prefix in place after any leading whitespace instead of
+    stripping, so large payloads are not copied just to test the start.
+    """
+    return _MESSAGEML_PREFIX.match(content) is None
+
+
+def _size_bdk_pools(bdk: Any, maxsize: Optional[int]) -> None:
+    """Size the HTTP connection pool of each API client built by the BDK.
+
+    The generated ``RESTClientObject`` copies ``connection_pool_maxsize``
+    when constructed but opens its aiohttp connector lazily on the first
+    request, so both are updated on the factory's clients before any call.
+    """
+    factory = getattr(bdk, "_api_client_factory", None)
+    if not maxsize or factory is None:
+        return
+    for client in vars(factory).values():
+        rest_client = getattr(client, "rest_client", None)
+        if rest_client is None:
+            continue
+        client.configuration.connection_pool_maxsize = maxsize
+        rest_client.maxsize = maxsize
+
+
+def _detached_copy(model: Any) -> Any:
+    """Shallow-copy a model, giving the copy its own list and dict field values."""
+    copy = model.model_copy()
+    fields = copy.__dict__
+    for key, value in fields.items():
+        if isinstance(value, (list, dict)):
+            fields[key] = value.copy()
+    return copy
+
+
+async def _resolved(value: Any) -> Any:
+    """Return ``value`` as an awaitable, for optional slots in ``asyncio.gather``."""
+    return value
+
+
+def _is_stale(fetched_at: Dict[str, float], key: str, ttl: Optional[float]) -> bool:
+    """Check whether a cached entry has outlived ``ttl`` seconds.
+
+    Entries added to a registry by other means have no fetch time, so
+    they count as stale whenever a TTL is configured.
+    """
+    if ttl is None:
+        return False
+    fetched = fetched_at.get(key)
+    return fetched is None or time.monotonic() - fetched > ttl
+
+
+def _field_getter(obj: Any) -> Callable[[str, Any], Any]:
+    """Get a ``(key, default)`` accessor for a dict or an attribute-style object."""
+    return obj.get if isinstance(obj, dict) else partial(getattr, obj)
+
+
+def _pluck(get: Callable[[str, Any], Any], keys: Tuple[str, ...]) -> Any:
+    """Return the first truthy value found under ``keys``, or None."""
+    for key in keys:
+        value = get(key, None)
+        if value:
+            return value
+    return None
+
+
+def _probe(obj: Any, path: Tuple[str, ...]) -> Any:
+    """Follow a key/attribute path through dicts or objects, returning None if any step is missing."""
+    for name in path:
+        if obj is None:
+            return None
+        obj = obj.get(name) if isinstance(obj, dict) else getattr(obj, name, None)
+    return obj
+
+
+def _probe_first(obj: Any, paths: Tuple[Tuple[str, ...], ...]) -> Any:
+    """Return the first truthy value found along ``paths``, or None."""
+    for path in paths:
+        value = _probe(obj, path)
+        if value:
+            return value
+    return None
+
 
 def _symphony_attachments(attachments_info: Any, stream_id: str, message_id: str) -> List[Attachment]:
     """Convert Symphony ``V4AttachmentInfo`` objects into chatom attachments.
@@ -128,6 +255,114 @@ def _symphony_attachments(attachments_info: Any, stream_id: str, message_id: str
     return result
 
 
+class _MessageCollector(RealTimeEventListener):
+    """Datafeed listener that puts messages for stream_messages into its queue."""
+
+    def __init__(
+        self,
+        queue: "asyncio.Queue[Message]",
+        filter_channel: Optional[str],
+        bot_id: Optional[str],
+        backend: "SymphonyBackend",
+        start_ms: int,
+        do_skip_own: bool,
+        do_skip_history: bool,
+    ):
+        self._queue = queue
+        self._filter_channel = filter_channel
+        self._bot_id = bot_id
+        self._backend = backend
+        self._start_ms = start_ms
+        self._skip_own = do_skip_own
+        self._skip_history = do_skip_history
+
+    async def on_message_sent(self, initiator: "V4Initiator", event: "V4MessageSent"):
+        msg = event.message
+        if not msg or not msg.stream:
+            return
+
+        # Filter by channel first, before building anything for unrelated traffic
+        stream_id = msg.stream.stream_id
+        if self._filter_channel and stream_id != self._filter_channel:
+            return
+
+        sender = initiator.user
+        sender_id = str(sender.user_id) if sender else None
+
+        # Skip bot's own messages
+        if self._skip_own and sender_id == self._bot_id:
+            return
+
+        # Skip messages from before the stream started, before building anything
+        ts_ms = int(msg.timestamp) if msg.timestamp else None
+        if self._skip_history and ts_ms is not None and ts_ms < self._start_ms:
+            return
+
+        # Extract mentions from data field and resolve to full SymphonyUser
+        # objects (with name/handle); most messages have none
+        mention_users: List[SymphonyUser] = []
+        for uid in SymphonyMessage.extract_mentions_from_data(msg.data):
+            uid_str = str(uid)
+            user = await self._backend._fetch_user_by_id(uid_str)
+            # Fallback to just ID if resolution fails
+            mention_users.append(_detached_copy(user) if user is not None else SymphonyUser(id=uid_str))
+
+        # Parse message timestamp
+        msg_timestamp = datetime.fromtimestamp(ts_ms / 1000, tz=timezone.utc) if ts_ms is not None else datetime.now(tz=timezone.utc)
+
+        # Determine stream type from the stream object
+        stream_type = _STREAM_TYPE_LOOKUP.get(getattr(msg.stream, "stream_type", None) or "ROOM")
+
+        # Lookup channel and author to get full info (id AND name), concurrently
+        channel, author = await asyncio.gather(
+            self._backend._fetch_channel_by_id(stream_id),
+            self._backend._fetch_user_by_id(sender_id) if sender_id else _resolved(None),
+        )
+        if channel is None and stream_type is not None:
+            # Create channel with at least the stream_type; the values are already typed
+            channel = SymphonyChannel.model_construct(
+                id=stream_id,
+                name="",  # Name not available in event
+                stream_type=stream_type,
+                channel_type=_stream_channel_type(stream_type),
+            )
+        elif channel is not None and stream_type is not None and channel.stream_type != stream_type:
+            # Update stream_type on a copy so the cached channel is left untouched
+            channel = channel.model_copy(update={"stream_type": stream_type, "channel_type": _stream_channel_type(stream_type, channel.public)})
+        elif channel is not None:
+            # Never hand out the cached channel itself
+            channel = _detached_copy(channel)
+
+        # Convert to SymphonyMessage; the fields are already typed, so skip revalidation
+        symphony_msg = SymphonyMessage.model_construct(
+            id=msg.message_id,
+            content=msg.message or "",
+            presentation_ml=msg.message or "",
+            author=_detached_copy(author) if author is not None else None,  # Use looked-up author with full info
+            channel=channel,
+            created_at=msg_timestamp,
+            data=msg.data,
+            mentions=mention_users,  # List of SymphonyUser objects
+            attachments=_symphony_attachments(getattr(msg, "attachments", None), stream_id, msg.message_id),
+        )
+
+        # If we didn't find the author via lookup, use info from initiator
+        if author is None and sender_id:
+            username = getattr(sender, "username", "") or sender_id
+            # If username looks like an email, use it as email
+            email = username if "@" in username else ""
+            user = SymphonyUser(
+                id=sender_id,
+                name=sender.display_name or sender_id,
+                handle=username,
+                email=email,
+            )
+            self._backend._cache_user(user)
+            symphony_msg.author = _detached_copy(user)
+
+        await self._queue.put(symphony_msg)
+
+
 class SymphonyBackend(BackendBase):
     """Symphony backend implementation using Symphony BDK.
 
@@ -167,8 +402,18 @@ class SymphonyBackend(BackendBase):
 
     # SDK instance
     _bdk: Any = None
+    # BDK service handles, resolved once in connect()
+    _user_service: Any = None
+    _stream_service: Any = None
+    _message_service: Any = None
+    _presence_service: Any = None
     _bot_user_id_int: Optional[int] = None
     _bot_user_name_cached: Optional[str] = None
+    # Monotonic fetch time per user/stream ID, for config.user_cache_ttl and channel_cache_ttl
+    _user_fetched_at: Dict[str, float] = {}
+    _channel_fetched_at: Dict[str, float] = {}
+    # In-flight lookups keyed by (kind, id), shared by concurrent callers
+    _inflight: Dict[Tuple[str, str], "asyncio.Future[Any]"] = {}
 
     @property
     def bot_user_id(self) -> Optional[str]:
@@ -206,8 +451,13 @@ class SymphonyBackend(BackendBase):
             # Create BDK configuration
             bdk_config = BdkConfig(**self.config.to_bdk_config())
 
-            # Initialize BDK
+            # Initialize BDK, sharing one sized connection pool per API client
             self._bdk = SymphonyBdk(bdk_config)
+            _size_bdk_pools(self._bdk, self.config.http_pool_max)
+            self._user_service = self._bdk.users()
+            self._stream_service = self._bdk.streams()
+            self._message_service = self._bdk.messages()
+            self._presence_service = self._bdk.presence()
 
             # Get bot session info
             session_service = self._bdk.sessions()
@@ -229,6 +479,10 @@ class SymphonyBackend(BackendBase):
                 pass
             self._bdk = None
 
+        self._user_service = None
+        self._stream_service = None
+        self._message_service = None
+        self._presence_service = None
         self._bot_user_id_int = None
         self._bot_user_name_cached = None
         self.connected = False
@@ -271,23 +525,22 @@ class SymphonyBackend(BackendBase):
         if identifier and not id:
             id = str(identifier)
 
-        # Check cache first for ID lookup
-        if id:
-            cached = self.users.get_by_id(id)
-            if cached:
-                return cached
+        # Check cache first for ID lookup, refetching entries past their TTL
+        cached = self.users.get_by_id(id) if id else None
+        if cached and not _is_stale(self._user_fetched_at, cached.id, self.config.user_cache_ttl):
+            return cached
 
         if self._bdk is None:
-            return None
+            return cached
 
-        # If we have an ID, fetch directly
+        # If we have an ID, fetch directly (keeping the stale entry if that fails)
         if id:
-            return await self._fetch_user_by_id(id)
+            return await self._fetch_user_by_id(id) or cached
 
         # Try to look up by email
         if email:
             try:
-                user_service = self._bdk.users()
+                user_service = self._user_service
                 results = await user_service.list_users_by_emails([email])
                 if results:
                     # Results is a dict with 'users' key
@@ -304,7 +557,7 @@ class SymphonyBackend(BackendBase):
         # Try to look up by username (handle)
         if handle:
             try:
-                user_service = self._bdk.users()
+                user_service = self._user_service
                 results = await user_service.list_users_by_usernames([handle])
                 if results:
                     # Results is a dict with 'users' key
@@ -321,14 +574,15 @@ class SymphonyBackend(BackendBase):
         # Search by display name
         if name:
             try:
-                user_service = self._bdk.users()
+                user_service = self._user_service
                 query = UserSearchQuery(query=name)
                 results = await user_service.search_users(query=query, local=True)
                 if results and hasattr(results, "users") and results.users:
                     # Find best match
+                    name_cf = name.casefold()
                     for user_data in results.users:
                         display = getattr(user_data, "display_name", None) or getattr(user_data, "displayName", "")
-                        if display.lower() == name.lower():
+                        if display.casefold() == name_cf:
                             return await self._fetch_user_by_id(str(user_data.id))
                     # If no exact match, return first result
                     if results.users:
@@ -341,20 +595,20 @@ class SymphonyBackend(BackendBase):
     def _build_user_from_data(self, user_data: Union[dict, Any]) -> Optional[SymphonyUser]:
         """Build a SymphonyUser from API response data (dict or object)."""
         try:
-            if isinstance(user_data, dict):
-                uid = user_data.get("id")
-                display_name = user_data.get("display_name") or user_data.get("displayName")
-                username = user_data.get("username")
-                email = user_data.get("email_address") or user_data.get("emailAddress")
-            else:
-                uid = getattr(user_data, "id", None)
-                display_name = getattr(user_data, "display_name", None) or getattr(user_data, "displayName", None)
-                username = getattr(user_data, "username", None)
-                email = getattr(user_data, "email_address", None) or getattr(user_data, "emailAddress", None)
-
+            get = _field_getter(user_data)
+            uid = get("id", None)
             if not uid:
                 return None
 
+            # Reuse a fresh cached user instead of rebuilding and revalidating it
+            existing = self._fresh_cached_user(str(uid))
+            if existing is not None:
+                return existing
+
+            display_name = _pluck(get, _USER_DISPLAY_NAME_KEYS)
+            username = get("username", None)
+            email = _probe_first(user_data, _USER_EMAIL_PATHS)
+
             # If email is not set but username looks like an email, use it
             if not email and username and "@" in username:
                 email = username
@@ -365,49 +619,90 @@ class SymphonyBackend(BackendBase):
                 handle=username or "",
                 email=email or "",
             )
-            self.users.add(user)
+            self._cache_user(user)
             return user
         except Exception:
             return None
 
+    def _ensure_connected(self) -> Any:
+        """Ensure the BDK is connected and return it.
+
+        Raises:
+            RuntimeError: If connect() has not been called.
+        """
+        bdk = self._bdk
+        if bdk is None:
+            raise RuntimeError("Symphony not connected")
+        return bdk
+
+    def _cache_user(self, user: SymphonyUser) -> None:
+        """Add a user to the registry and record when it was cached."""
+        self.users.add(user)
+        self._user_fetched_at[user.id] = time.monotonic()
+
+    def _fresh_cached_user(self, user_id: str) -> Optional[SymphonyUser]:
+        """Get a cached Symphony user that has not outlived its TTL."""
+        cached = self.users.get_by_id(user_id)
+        if isinstance(cached, SymphonyUser) and not _is_stale(self._user_fetched_at, user_id, self.config.user_cache_ttl):
+            return cached
+        return None
+
+    def _fresh_cached_channel(self, stream_id: str) -> Optional[SymphonyChannel]:
+        """Get a cached Symphony channel that has not outlived its TTL."""
+        cached = self.channels.get_by_id(stream_id)
+        if isinstance(cached, SymphonyChannel) and not _is_stale(self._channel_fetched_at, stream_id, self.config.channel_cache_ttl):
+            return cached
+        return None
+
+    def _user_id_int(self, user: Union[str, User]) -> int:
+        """Get the integer user ID the Symphony API expects.
+
+        Reuses the ID already parsed on a ``SymphonyUser`` (passed in or
+        found in the user cache) before falling back to ``int()``.
+        """
+        if not isinstance(user, SymphonyUser):
+            user_id = user.id if isinstance(user, User) else user
+            cached = self.users.get_by_id(user_id)
+            if not isinstance(cached, SymphonyUser):
+                return int(user_id)
+            user = cached
+        value = user.user_id_int
+        if value is None:
+            raise ValueError(f"Invalid Symphony user ID: {user.id!r}")
+        return value
+
+    def _user_ids_int(self, users: Iterable[Union[str, User]]) -> List[int]:
+        """Convert users to de-duplicated integer IDs, preserving order.
+
+        Raises:
+            ValueError: Naming every ID that is not numeric.
+        """
+        user_ids: Dict[int, None] = {}
+        invalid: List[str] = []
+        for user in users:
+            try:
+                user_ids[self._user_id_int(user)] = None
+            except ValueError:
+                invalid.append(user.id if isinstance(user, User) else str(user))
+        if invalid:
+            raise ValueError(f"Invalid Symphony user IDs: {', '.join(invalid)}")
+        return list(user_ids)
+
     async def _fetch_user_by_id(self, user_id: str) -> Optional[SymphonyUser]:
         """Fetch a user by ID from the Symphony API."""
+        existing = self._fresh_cached_user(user_id)
+        if existing is not None:
+            return existing
+        return await _coalesce(self._inflight, ("user", user_id), lambda: self._load_user_by_id(user_id))
+
+    async def _load_user_by_id(self, user_id: str) -> Optional[SymphonyUser]:
+        """Load a user by ID from the Symphony API, bypassing the cache."""
         try:
-            user_service = self._bdk.users()
+            user_service = self._user_service
             user_data = await user_service.get_user_detail(int(user_id))
-
-            # Handle both dict and object responses
-            if isinstance(user_data, dict):
-                uid = user_data.get("id")
-                display_name = user_data.get("display_name") or user_data.get("displayName")
-                username = user_data.get("username")
-                email = user_data.get("email_address") or user_data.get("emailAddress") or user_data.get("email")
-            else:
-                uid = user_data.id
-                display_name = getattr(user_data, "display_name", None) or getattr(user_data, "displayName", None)
-                username = user_data.username
-                # Try multiple email field names
-                email = getattr(user_data, "email_address", None) or getattr(user_data, "emailAddress", None) or getattr(user_data, "email", None)
-                # V2UserDetail has email in user_attributes.email_address
-                if not email and hasattr(user_data, "user_attributes"):
-                    attrs = user_data.user_attributes
-                    if attrs:
-                        email = getattr(attrs, "email_address", None) or getattr(attrs, "emailAddress", None)
-
-            # If email is not set but username looks like an email, use it
-            if not email and username and "@" in username:
-                email = username
-
-            user = SymphonyUser(
-                id=str(uid),
-                name=display_name or username,
-                handle=username,
-                email=email or "",
-            )
-            self.users.add(user)
-            return user
         except Exception:
             return None
+        return self._build_user_from_data(user_data)
 
     async def fetch_channel(
         self,
@@ -460,7 +755,7 @@ class SymphonyBackend(BackendBase):
         # Search by room name
         if name:
             try:
-                stream_service = self._bdk.streams()
+                stream_service = self._stream_service
                 log.info(f"Searching for room by name: {name}")
                 results = await stream_service.search_rooms(V2RoomSearchCriteria(query=name), limit=10)
                 log.info(f"Room search results: {results.count if results else 0} rooms found")
@@ -484,8 +779,15 @@ class SymphonyBackend(BackendBase):
 
     async def _fetch_channel_by_id(self, stream_id: str) -> Optional[SymphonyChannel]:
         """Fetch a channel by stream ID from the Symphony API."""
+        existing = self._fresh_cached_channel(stream_id)
+        if existing is not None:
+            return existing
+        return await _coalesce(self._inflight, ("channel", stream_id), lambda: self._load_channel_by_id(stream_id))
+
+    async def _load_channel_by_id(self, stream_id: str) -> Optional[SymphonyChannel]:
+        """Load a channel by stream ID from the Symphony API, bypassing the cache."""
         try:
-            stream_service = self._bdk.streams()
+            stream_service = self._stream_service
             stream_info = await stream_service.get_stream(stream_id)
 
             channel = SymphonyChannel(
@@ -493,6 +795,7 @@ class SymphonyBackend(BackendBase):
                 name=getattr(stream_info, "name", None) or stream_id,
             )
             self.channels.add(channel)
+            self._channel_fetched_at[stream_id] = time.monotonic()
             return channel
         except Exception:
             return None
@@ -514,8 +817,7 @@ class SymphonyBackend(BackendBase):
         Returns:
             List of users who are members of the room.
         """
-        if self._bdk is None:
-            raise RuntimeError("Symphony not connected")
+        self._ensure_connected()
 
         # Resolve channel ID
         channel_id = None
@@ -539,7 +841,7 @@ class SymphonyBackend(BackendBase):
             return []
 
         try:
-            stream_service = self._bdk.streams()
+            stream_service = self._stream_service
             membership_list = await stream_service.list_room_members(channel_id)
             members: List[User] = []
             if membership_list and membership_list.value:
@@ -571,8 +873,7 @@ class SymphonyBackend(BackendBase):
         Returns:
             List of messages, ordered oldest-first.
         """
-        if self._bdk is None:
-            raise RuntimeError("Symphony not connected")
+        self._ensure_connected()
 
         # Resolve channel ID
         channel_id = await self._resolve_channel_id(channel)
@@ -594,7 +895,7 @@ class SymphonyBackend(BackendBase):
 
     async def _fetch_messages_since(self, channel_id: str, since_ms: int, limit: int) -> List[Message]:
         """Fetch up to *limit* messages after a given timestamp."""
-        message_service = self._bdk.messages()
+        message_service = self._message_service
         try:
             messages_data = await message_service.list_messages(stream_id=channel_id, since=since_ms, limit=limit)
         except Exception as e:
@@ -611,7 +912,6 @@ class SymphonyBackend(BackendBase):
         ``limit`` messages (or hit the 90-day backstop).  Within each window
         we use ``skip``-based pagination to fetch ALL messages.
         """
-        message_service = self._bdk.messages()
         now_ms = int(datetime.now(timezone.utc).timestamp() * 1000)
         page_limit = 500  # Symphony API max per request
         max_backstop_ms = now_ms - int(timedelta(days=90).total_seconds() * 1000)
@@ -623,25 +923,7 @@ class SymphonyBackend(BackendBase):
                 window_start_ms = max_backstop_ms
 
             # Fetch ALL messages from window_start to now via skip pagination
-            all_in_window: list = []
-            skip = 0
-            while True:
-                try:
-                    batch = await message_service.list_messages(
-                        stream_id=channel_id,
-                        since=window_start_ms,
-                        skip=skip,
-                        limit=page_limit,
-                    )
-                except Exception as e:
-                    raise RuntimeError(f"Failed to fetch messages: {e}") from e
-
-                if not batch:
-                    break
-                all_in_window.extend(batch)
-                if len(batch) < page_limit:
-                    break  # got everything in this window
-                skip += len(batch)
+            all_in_window = await self._fetch_message_window(channel_id, window_start_ms, page_limit)
 
             if len(all_in_window) >= limit:
                 # We have enough — convert and take the most recent `limit`
@@ -656,21 +938,71 @@ class SymphonyBackend(BackendBase):
             # Not enough — widen the window and retry
             window_hours = min(window_hours * 2, 24 * 90)
 
+    async def _fetch_message_page(self, channel_id: str, since_ms: int, skip: int, limit: int) -> list:
+        """Fetch a single ``list_messages`` page."""
+        try:
+            batch = await self._message_service.list_messages(stream_id=channel_id, since=since_ms, skip=skip, limit=limit)
+        except Exception as e:
+            raise RuntimeError(f"Failed to fetch messages: {e}") from e
+        return list(batch or [])
+
+    async def _fetch_message_window(self, channel_id: str, since_ms: int, page_limit: int) -> list:
+        """Fetch every message since *since_ms*, oldest-first.
+
+        The first page is fetched alone since most windows fit in it.  After a
+        full page, the following ``config.message_page_concurrency`` pages are
+        requested together, until a short page marks the end of the window.
+        """
+        messages = await self._fetch_message_page(channel_id, since_ms, 0, page_limit)
+        if len(messages) < page_limit:
+            return messages
+
+        concurrency = max(1, self.config.message_page_concurrency)
+        while True:
+            skip = len(messages)
+            pages = await asyncio.gather(
+                *(self._fetch_message_page(channel_id, since_ms, skip + i * page_limit, page_limit) for i in range(concurrency))
+            )
+            for page in pages:
+                messages.extend(page)
+                if len(page) < page_limit:
+                    return messages
+
     def _convert_messages(self, messages_data: list, channel_id: str) -> List[Message]:
-        """Convert raw V4Message objects to SymphonyMessage instances."""
-        messages: List[Message] = []
-        for msg in messages_data:
-            messages.append(
-                SymphonyMessage(
-                    id=msg.message_id,
-                    content=msg.message,
-                    created_at=datetime.fromtimestamp(msg.timestamp / 1000, tz=timezone.utc),
-                    author=SymphonyUser(id=str(msg.user.user_id)) if msg.user else None,
-                    channel=SymphonyChannel(id=channel_id),
-                    attachments=_symphony_attachments(getattr(msg, "attachments", None), channel_id, msg.message_id),
-                )
+        """Convert raw V4Message objects to SymphonyMessage instances.
+
+        The V4Message fields come straight from the BDK's generated models,
+        so the outer message is built with ``model_construct`` to skip
+        revalidation on large history pulls.  The stream is validated once per
+        batch and each distinct author once; every message then gets its own
+        copy, so editing one message's channel or author leaves the others
+        untouched.
+        """
+        _construct = SymphonyMessage.model_construct
+        _fromts = datetime.fromtimestamp
+        _utc = timezone.utc
+        channel = SymphonyChannel(id=channel_id)
+        authors: Dict[Any, SymphonyUser] = {}
+
+        def _author(user: Any) -> Optional[SymphonyUser]:
+            if not user:
+                return None
+            author = authors.get(user.user_id)
+            if author is None:
+                author = authors[user.user_id] = SymphonyUser(id=str(user.user_id))
+            return _detached_copy(author)
+
+        return [
+            _construct(
+                id=msg.message_id,
+                content=msg.message,
+                created_at=_fromts(msg.timestamp / 1000, _utc),
+                author=_author(msg.user),
+                channel=_detached_copy(channel),
+                attachments=_symphony_attachments(getattr(msg, "attachments", None), channel_id, msg.message_id),
             )
-        return messages
+            for msg in messages_data
+        ]
 
     async def search_messages(
         self,
@@ -695,11 +1027,10 @@ class SymphonyBackend(BackendBase):
         Returns:
             List of messages matching the query.
         """
-        if self._bdk is None:
-            raise RuntimeError("Symphony not connected")
+        self._ensure_connected()
 
         try:
-            message_service = self._bdk.messages()
+            message_service = self._message_service
 
             # Build search parameters
             search_params: dict = {
@@ -762,8 +1093,7 @@ class SymphonyBackend(BackendBase):
         Returns:
             The sent message.
         """
-        if self._bdk is None:
-            raise RuntimeError("Symphony not connected")
+        self._ensure_connected()
 
         # Drop standardized thread/reply_to kwargs: Symphony has no
         # corresponding concept (single timeline, no native reply).
@@ -776,10 +1106,10 @@ class SymphonyBackend(BackendBase):
         channel_id = await self._resolve_channel_id(channel)
 
         try:
-            message_service = self._bdk.messages()
+            message_service = self._message_service
 
             # Ensure content is wrapped in messageML tags
-            if not content.strip().startswith("<messageML>"):
+            if self.config.messageml_auto_wrap and _needs_messageml_wrap(content):
                 content = f"<messageML>{content}</messageML>"
 
             # Build message params
@@ -823,8 +1153,7 @@ class SymphonyBackend(BackendBase):
         import os
         import tempfile
 
-        if self._bdk is None:
-            raise RuntimeError("Symphony not connected")
+        self._ensure_connected()
 
         channel_id = await self._resolve_channel_id(channel)
 
@@ -834,9 +1163,9 @@ class SymphonyBackend(BackendBase):
             os.write(fd, data)
             os.close(fd)
 
-            message_service = self._bdk.messages()
+            message_service = self._message_service
             body = content or title or filename
-            if not body.strip().startswith("<messageML>"):
+            if self.config.messageml_auto_wrap and _needs_messageml_wrap(body):
                 body = f"<messageML>{body}</messageML>"
 
             result = await message_service.send_message(
@@ -877,8 +1206,7 @@ class SymphonyBackend(BackendBase):
         if attachment.data is not None:
             return attachment.data
 
-        if self._bdk is None:
-            raise RuntimeError("Symphony not connected")
+        self._ensure_connected()
 
         meta = getattr(attachment, "metadata", {}) or {}
         stream_id = meta.get("stream_id") or (message.channel_id if message else "")
@@ -891,7 +1219,7 @@ class SymphonyBackend(BackendBase):
                 "(pass the owning message= or use an attachment received from this backend)."
             )
 
-        message_service = self._bdk.messages()
+        message_service = self._message_service
         encoded = await message_service.get_attachment(
             stream_id=stream_id,
             message_id=message_id,
@@ -922,17 +1250,16 @@ class SymphonyBackend(BackendBase):
         Returns:
             The edited message.
         """
-        if self._bdk is None:
-            raise RuntimeError("Symphony not connected")
+        self._ensure_connected()
 
         # Resolve message and channel IDs
         channel_id, message_id = await self._resolve_message_id(message, channel)
 
         try:
-            message_service = self._bdk.messages()
+            message_service = self._message_service
 
             # Ensure content is wrapped in messageML tags
-            if not content.strip().startswith("<messageML>"):
+            if self.config.messageml_auto_wrap and _needs_messageml_wrap(content):
                 content = f"<messageML>{content}</messageML>"
 
             result = await message_service.update_message(
@@ -964,8 +1291,7 @@ class SymphonyBackend(BackendBase):
             message: The message to delete (ID string or Message object).
             channel: The stream containing the message (not used for Symphony).
         """
-        if self._bdk is None:
-            raise RuntimeError("Symphony not connected")
+        self._ensure_connected()
 
         # Resolve message ID (channel not needed for Symphony suppress)
         if isinstance(message, Message):
@@ -974,7 +1300,7 @@ class SymphonyBackend(BackendBase):
             message_id = message
 
         try:
-            message_service = self._bdk.messages()
+            message_service = self._message_service
             await message_service.suppress_message(message_id)
 
         except Exception as e:
@@ -1004,8 +1330,7 @@ class SymphonyBackend(BackendBase):
         Returns:
             The forwarded message in the destination stream.
         """
-        if self._bdk is None:
-            raise RuntimeError("Symphony not connected")
+        self._ensure_connected()
 
         # Resolve the source message if it's just an ID
         if isinstance(message, str):
@@ -1015,7 +1340,7 @@ class SymphonyBackend(BackendBase):
         dest_channel_id = await self._resolve_channel_id(to_channel)
 
         try:
-            message_service = self._bdk.messages()
+            message_service = self._message_service
 
             # Build the forwarded message content in MessageML
             # Styled to resemble Symphony's native forwarded message UI
@@ -1106,14 +1431,13 @@ class SymphonyBackend(BackendBase):
             **kwargs: Additional options:
                 - soft: If True, respect current activity state.
         """
-        if self._bdk is None:
-            raise RuntimeError("Symphony not connected")
+        self._ensure_connected()
 
         if not HAS_SYMPHONY:
             raise RuntimeError("symphony-bdk is not installed")
 
         try:
-            presence_service = self._bdk.presence()
+            presence_service = self._presence_service
 
             # Map status to Symphony presence
             mapped_status = PRESENCE_MAP.get(status.lower(), "AVAILABLE")
@@ -1143,40 +1467,15 @@ class SymphonyBackend(BackendBase):
         user_id = user.id if isinstance(user, User) else user
 
         try:
-            presence_service = self._bdk.presence()
-            presence_data = await presence_service.get_user_presence(int(user_id), local=False)
-
-            # Map Symphony presence to our enum
-            status_map = {
-                "AVAILABLE": SymphonyPresenceStatus.AVAILABLE,
-                "BUSY": SymphonyPresenceStatus.BUSY,
-                "AWAY": SymphonyPresenceStatus.AWAY,
-                "ON_THE_PHONE": SymphonyPresenceStatus.ON_THE_PHONE,
-                "BE_RIGHT_BACK": SymphonyPresenceStatus.BE_RIGHT_BACK,
-                "IN_A_MEETING": SymphonyPresenceStatus.IN_A_MEETING,
-                "OUT_OF_OFFICE": SymphonyPresenceStatus.OUT_OF_OFFICE,
-                "OFF_WORK": SymphonyPresenceStatus.OFF_WORK,
-                "OFFLINE": SymphonyPresenceStatus.OFFLINE,
-            }
+            presence_service = self._presence_service
+            presence_data = await presence_service.get_user_presence(self._user_id_int(user), local=False)
 
-            symphony_status = status_map.get(presence_data.category, SymphonyPresenceStatus.OFFLINE)
-
-            # Map Symphony status to base PresenceStatus
-            base_status_map = {
-                SymphonyPresenceStatus.AVAILABLE: BasePresenceStatus.ONLINE,
-                SymphonyPresenceStatus.BUSY: BasePresenceStatus.DND,
-                SymphonyPresenceStatus.ON_THE_PHONE: BasePresenceStatus.DND,
-                SymphonyPresenceStatus.IN_A_MEETING: BasePresenceStatus.DND,
-                SymphonyPresenceStatus.AWAY: BasePresenceStatus.IDLE,
-                SymphonyPresenceStatus.BE_RIGHT_BACK: BasePresenceStatus.IDLE,
-                SymphonyPresenceStatus.OUT_OF_OFFICE: BasePresenceStatus.IDLE,
-                SymphonyPresenceStatus.OFF_WORK: BasePresenceStatus.OFFLINE,
-                SymphonyPresenceStatus.OFFLINE: BasePresenceStatus.OFFLINE,
-            }
-            base_status = base_status_map.get(symphony_status, BasePresenceStatus.UNKNOWN)
+            # Map Symphony presence to our enum, then to base PresenceStatus
+            symphony_status = _CATEGORY_TO_STATUS.get(presence_data.category, _DEFAULT_STATUS)
+            base_status = _STATUS_TO_BASE_STATUS.get(symphony_status, BasePresenceStatus.UNKNOWN)
 
             user = SymphonyUser(id=user_id)
-            return SymphonyPresence(
+            return SymphonyPresence.model_construct(
                 user=user,
                 status=base_status,
                 symphony_status=symphony_status,
@@ -1238,7 +1537,7 @@ class SymphonyBackend(BackendBase):
         if isinstance(user, SymphonyUser):
             return _mention_user(user)
         # For base User, use ID as user_id
-        return f'<mention uid="{user.id}"/>'
+        return mention_user_by_uid(user.id)
 
     def mention_channel(self, channel: Channel) -> str:
         """Format a channel mention for Symphony.
@@ -1299,26 +1598,21 @@ class SymphonyBackend(BackendBase):
         Returns:
             The stream ID of the created DM.
         """
-        if self._bdk is None:
-            raise RuntimeError("Symphony not connected")
+        self._ensure_connected()
 
         try:
-            stream_service = self._bdk.streams()
+            stream_service = self._stream_service
 
-            # Resolve user IDs
-            user_ids: List[str] = []
+            # Resolve users, keeping User objects so cached int IDs can be reused
+            resolved_users: List[Union[str, User]] = []
             for user in users:
-                if isinstance(user, User):
-                    if user.is_incomplete:
-                        resolved = await self.resolve_user(user)
-                        user_ids.append(resolved.id)
-                    else:
-                        user_ids.append(user.id)
+                if isinstance(user, User) and user.is_incomplete:
+                    resolved_users.append(await self.resolve_user(user))
                 else:
-                    user_ids.append(user)
+                    resolved_users.append(user)
 
-            # Convert string IDs to int for Symphony API
-            int_user_ids = [int(uid) for uid in user_ids]
+            # Convert to int IDs for Symphony API, which rejects duplicates
+            int_user_ids = self._user_ids_int(resolved_users)
 
             # Use the underlying v1/im/create API which supports both 1:1 IMs and MIMs
             # The caller (bot) is implicitly included as a participant
@@ -1365,11 +1659,10 @@ class SymphonyBackend(BackendBase):
         Returns:
             The stream ID of the created room.
         """
-        if self._bdk is None:
-            raise RuntimeError("Symphony not connected")
+        self._ensure_connected()
 
         try:
-            stream_service = self._bdk.streams()
+            stream_service = self._stream_service
             read_only = kwargs.get("read_only", False)
 
             # Create V3RoomAttributes with proper fields
@@ -1435,6 +1728,8 @@ class SymphonyBackend(BackendBase):
         channel: Optional[Union[str, Channel]] = None,
         skip_own: bool = True,
         skip_history: bool = True,
+        *,
+        queue_maxsize: Optional[int] = None,
     ) -> "AsyncIterator[Message]":
         """Stream incoming messages in real-time using Symphony datafeed.
 
@@ -1445,12 +1740,14 @@ class SymphonyBackend(BackendBase):
             skip_own: If True (default), skip messages sent by the bot itself.
             skip_history: If True (default), skip messages that existed before
                          the stream started. Only yields new messages.
+            queue_maxsize: Messages buffered before the datafeed waits for the
+                           consumer. Defaults to ``config.stream_queue_maxsize``;
+                           larger values absorb bursts at the cost of memory.
 
         Yields:
             Message: Each message as it arrives.
         """
-        if self._bdk is None:
-            raise RuntimeError("Symphony not connected")
+        bdk = self._ensure_connected()
 
         # Resolve channel ID if provided
         channel_id: Optional[str] = None
@@ -1464,154 +1761,52 @@ class SymphonyBackend(BackendBase):
         bot_info = await self.get_bot_info()
         bot_user_id = str(bot_info.id) if bot_info else None
 
-        # Track when the stream started for skip_history
-        stream_start_time = datetime.now(tz=timezone.utc)
-
-        # Create a queue for messages
-        message_queue: "asyncio.Queue[Message]" = asyncio.Queue()
-        stop_event = asyncio.Event()
-
-        class MessageCollector(RealTimeEventListener):
-            """Internal listener that puts messages into the queue."""
-
-            def __init__(
-                self,
-                queue: "asyncio.Queue[Message]",
-                filter_channel: Optional[str],
-                bot_id: Optional[str],
-                backend: "SymphonyBackend",
-                start_time: datetime,
-                do_skip_own: bool,
-                do_skip_history: bool,
-            ):
-                self._queue = queue
-                self._filter_channel = filter_channel
-                self._bot_id = bot_id
-                self._backend = backend
-                self._start_time = start_time
-                self._skip_own = do_skip_own
-                self._skip_history = do_skip_history
-
-            async def on_message_sent(self, initiator: V4Initiator, event: V4MessageSent):
-                msg = event.message
-                if not msg or not msg.stream:
-                    return
-
-                stream_id = msg.stream.stream_id
-                sender_id = str(initiator.user.user_id) if initiator.user else None
-
-                # Skip bot's own messages
-                if self._skip_own and sender_id == self._bot_id:
-                    return
-
-                # Filter by channel if specified
-                if self._filter_channel and stream_id != self._filter_channel:
-                    return
-
-                # Extract mentions from data field and resolve to full User objects
-                mention_ids_int = SymphonyMessage.extract_mentions_from_data(msg.data)
-                # Resolve mention IDs to full SymphonyUser objects (with name/handle)
-                mention_users = []
-                for uid in mention_ids_int:
-                    user = await self._backend._fetch_user_by_id(str(uid))
-                    if user:
-                        mention_users.append(user)
-                    else:
-                        # Fallback to just ID if resolution fails
-                        mention_users.append(SymphonyUser(id=str(uid)))
-
-                # Parse message timestamp
-                msg_timestamp = datetime.fromtimestamp(int(msg.timestamp) / 1000, tz=timezone.utc) if msg.timestamp else datetime.now(tz=timezone.utc)
-
-                # Skip messages from before the stream started
-                if self._skip_history and msg_timestamp < self._start_time:
-                    return
+        # Track when the stream started for skip_history, in epoch ms like datafeed timestamps
+        stream_start_ms = int(datetime.now(tz=timezone.utc).timestamp() * 1000)
 
-                # Determine stream type from the stream object
-                stream_type_str = getattr(msg.stream, "stream_type", None) or "ROOM"
-                try:
-                    stream_type = SymphonyStreamType(stream_type_str)
-                except ValueError:
-                    stream_type = None
-
-                # Lookup channel to get full info (id AND name)
-                channel = await self._backend._fetch_channel_by_id(stream_id)
-                if channel is None and stream_type is not None:
-                    # Create channel with at least the stream_type
-                    channel = SymphonyChannel(
-                        id=stream_id,
-                        name="",  # Name not available in event
-                        stream_type=stream_type,
-                    )
-                elif channel is not None and stream_type is not None:
-                    # Update stream_type if we have it
-                    channel = SymphonyChannel(
-                        id=channel.id,
-                        name=channel.name,
-                        stream_type=stream_type,
-                    )
-
-                # Lookup author to get full info (id AND name)
-                author = None
-                if sender_id:
-                    author = await self._backend._fetch_user_by_id(sender_id)
-
-                # Convert to SymphonyMessage
-                symphony_msg = SymphonyMessage(
-                    id=msg.message_id,
-                    content=msg.message or "",
-                    presentation_ml=msg.message or "",
-                    author=author,  # Use looked-up author with full info
-                    channel=channel,
-                    created_at=msg_timestamp,
-                    data=msg.data,
-                    mentions=list(mention_users),  # List of SymphonyUser objects
-                    attachments=_symphony_attachments(getattr(msg, "attachments", None), stream_id, msg.message_id),
-                )
-
-                # If we didn't find the author via lookup, use info from initiator
-                if author is None and initiator.user:
-                    username = getattr(initiator.user, "username", "") or str(initiator.user.user_id)
-                    # If username looks like an email, use it as email
-                    email = username if "@" in username else ""
-                    user = SymphonyUser(
-                        id=sender_id or "",
-                        name=initiator.user.display_name or str(initiator.user.user_id),
-                        handle=username,
-                        email=email,
-                    )
-                    self._backend.users.add(user)
-                    symphony_msg.author = user
-
-                await self._queue.put(symphony_msg)
+        # Create a bounded queue for messages, ended by the _STREAM_END sentinel.
+        # A full queue blocks the collector, applying backpressure to the datafeed.
+        message_queue: "asyncio.Queue[Any]" = asyncio.Queue(maxsize=self.config.stream_queue_maxsize if queue_maxsize is None else queue_maxsize)
 
         # Set up the datafeed
-        datafeed_loop = self._bdk.datafeed()
-        collector = MessageCollector(
+        datafeed_loop = bdk.datafeed()
+        collector = _MessageCollector(
             message_queue,
             channel_id,
             bot_user_id,
             self,
-            stream_start_time,
+            stream_start_ms,
             skip_own,
             skip_history,
         )
         datafeed_loop.subscribe(collector)
 
-        # Start datafeed in background
+        def _end_stream(_: Any) -> None:
+            # If the queue is full, the consumer drains it and then sees the datafeed is done
+            with contextlib.suppress(asyncio.QueueFull):
+                message_queue.put_nowait(_STREAM_END)
+
+        # Start datafeed in background, waking the consumer if it ever stops
         datafeed_task = asyncio.create_task(datafeed_loop.start())
+        datafeed_task.add_done_callback(_end_stream)
 
         try:
-            while not stop_event.is_set():
-                try:
-                    # Wait for messages with a timeout to allow checking stop_event
-                    message = await asyncio.wait_for(message_queue.get(), timeout=1.0)
+            while True:
+                # Take a burst of queued messages per wakeup, then yield them without awaiting
+                pending = [await message_queue.get()]
+                while len(pending) < _STREAM_DRAIN_MAX:
+                    try:
+                        pending.append(message_queue.get_nowait())
+                    except asyncio.QueueEmpty:
+                        break
+                for message in pending:
+                    if message is _STREAM_END:
+                        return
                     yield message
-                except asyncio.TimeoutError:
-                    continue
+                if datafeed_task.done() and message_queue.empty():
+                    return
         finally:
             # Clean up
-            stop_event.set()
             await datafeed_loop.stop()
             datafeed_task.cancel()
             try:
@@ -31,6 +31,24 @@ class SymphonyStreamType(str, Enum):
     """Wall post."""
 
 
+# Raw stream type strings from the BDK to the enum, for lookups that must not raise
+_STREAM_TYPE_LOOKUP = {t.value: t for t in SymphonyStreamType}
+
+# Stream types with a fixed generic channel type; rooms and posts depend on ``public``
+_STREAM_CHANNEL_TYPES = {
+    SymphonyStreamType.IM: ChannelType.DIRECT,
+    SymphonyStreamType.MIM: ChannelType.GROUP,
+}
+
+
+def _stream_channel_type(stream_type: SymphonyStreamType, public: bool = False) -> ChannelType:
+    """Map a Symphony stream type (and room visibility) to the generic channel type."""
+    channel_type = _STREAM_CHANNEL_TYPES.get(stream_type)
+    if channel_type is not None:
+        return channel_type
+    return ChannelType.PUBLIC if public else ChannelType.PRIVATE
+
+
 class SymphonyChannel(Channel):
     """Symphony-specific channel (stream) with additional Symphony fields.
 
@@ -85,17 +103,15 @@ class SymphonyChannel(Channel):
         Returns:
             ChannelType: The generic channel type.
         """
-        if self.stream_type == SymphonyStreamType.IM:
-            return ChannelType.DIRECT
-        elif self.stream_type == SymphonyStreamType.MIM:
-            return ChannelType.GROUP
-        elif self.public:
-            return ChannelType.PUBLIC
-        return ChannelType.PRIVATE
+        return _stream_channel_type(self.stream_type, self.public)
 
     @model_validator(mode="after")
     def _sync_channel_type(self) -> "SymphonyChannel":
-        """Sync channel_type from Symphony stream_type."""
+        """Sync channel_type from Symphony stream_type.
+
+        Callers that already know the channel type can pass ``channel_type``
+        to skip the derivation.
+        """
         # Only update if not already set to a meaningful value
         if self.channel_type == ChannelType.UNKNOWN:
             object.__setattr__(self, "channel_type", self.generic_channel_type)
@@ -4,16 +4,27 @@ This module provides the SymphonyConfig class for configuring
 the Symphony backend with the Symphony BDK.
 """
 
+import asyncio
 import atexit
 import logging
 import os
 import tempfile
 import threading
-from typing import TYPE_CHECKING, Any, Dict, Optional, Union, cast
+from typing import TYPE_CHECKING, Any, Dict, Optional, Set, Tuple, Union, cast
 
 from pydantic import Field, SecretStr, model_validator
 
 from ..backend import BackendConfig
+from ._util import _coalesce
+
+try:
+    from symphony.bdk.core.config.model.bdk_config import BdkConfig
+    from symphony.bdk.gen.configuration import Configuration
+    from symphony.bdk.gen.pod_model.v2_room_search_criteria import V2RoomSearchCriteria
+except ImportError:
+    BdkConfig = None
+    Configuration = None
+    V2RoomSearchCriteria = None
 
 if TYPE_CHECKING:
     from .backend import SymphonyBackend
@@ -22,6 +33,20 @@ __all__ = ("SymphonyConfig", "SymphonyRoomMapper")
 
 log = logging.getLogger(__name__)
 
+# Temp certificate files written from bot_certificate_content, removed at exit
+_temp_cert_paths: Set[str] = set()
+
+
+@atexit.register
+def _cleanup_temp_cert_files() -> None:
+    """Remove temp certificate files that were not cleaned up explicitly."""
+    for path in list(_temp_cert_paths):
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+    _temp_cert_paths.clear()
+
 
 class SymphonyConfig(BackendConfig):
     """Configuration for the Symphony backend.
@@ -96,6 +121,12 @@ class SymphonyConfig(BackendConfig):
     # Internal: Path to temp cert file (created from bot_certificate_content)
     _temp_cert_path: Optional[str] = None
 
+    # Internal: Memoized to_bdk_config() and pod_url results, keyed on the field dict they were built from.
+    # Validated assignment and model_copy both install a new field dict, which invalidates it.
+    # Both are accessed through __pydantic_private__ to skip the slow BaseModel.__getattr__ lookup.
+    _bdk_config_cache: Optional[Tuple[Dict[str, Any], Dict[str, Any]]] = None
+    _pod_url_cache: Optional[Tuple[Dict[str, Any], str]] = None
+
     # Application configuration (for extension apps)
     app_id: Optional[str] = None
     app_private_key_path: Optional[str] = None
@@ -121,6 +152,10 @@ class SymphonyConfig(BackendConfig):
 
     # Connection settings
     timeout: int = Field(default=30, description="Request timeout in seconds")
+    http_pool_max: Optional[int] = Field(
+        default=None,
+        description="Maximum pooled HTTP connections per BDK API client. None keeps the BDK default.",
+    )
 
     # Error handling and retry configuration
     error_room: Optional[str] = Field(
@@ -152,6 +187,35 @@ class SymphonyConfig(BackendConfig):
         description="Version of datafeed to use ('v1' or 'v2').",
     )
 
+    # Cache settings
+    user_cache_ttl: Optional[float] = Field(
+        None,
+        description="Seconds before a cached user is refetched from Symphony. None keeps cached users indefinitely.",
+    )
+    channel_cache_ttl: Optional[float] = Field(
+        None,
+        description="Seconds before a cached stream is refetched from Symphony. None keeps cached streams indefinitely.",
+    )
+
+    # Streaming settings
+    stream_queue_maxsize: int = Field(
+        256,
+        description="Maximum datafeed messages buffered by stream_messages before the datafeed waits for the consumer.",
+    )
+
+    # Message settings
+    message_page_concurrency: int = Field(
+        4,
+        description="Number of message history pages requested concurrently when paging through a busy stream.",
+    )
+    messageml_auto_wrap: bool = Field(
+        True,
+        description=(
+            "Wrap outgoing content in <messageML> tags when missing. Disable when content "
+            "is always pre-wrapped to skip the prefix scan on large payloads."
+        ),
+    )
+
     # SSL configuration
     ssl_trust_store_path: Optional[str] = Field(
         None,
@@ -185,25 +249,16 @@ class SymphonyConfig(BackendConfig):
                 if isinstance(self.bot_certificate_content, SecretStr)
                 else self.bot_certificate_content
             )
-            fd, temp_path = tempfile.mkstemp(suffix=".pem", prefix="chatom_cert_")
-            try:
-                os.write(fd, cert_content.encode("utf-8"))
-            finally:
-                os.close(fd)
+            with tempfile.NamedTemporaryFile(mode="wb", suffix=".pem", prefix="chatom_cert_", delete=False) as f:
+                f.write(cert_content.encode("utf-8"))
+            temp_path = f.name
 
             # Store and set the temp path
             object.__setattr__(self, "_temp_cert_path", temp_path)
             object.__setattr__(self, "bot_certificate_path", temp_path)
 
-            # Register cleanup on exit
-            def cleanup_temp_cert():
-                try:
-                    if os.path.exists(temp_path):
-                        os.unlink(temp_path)
-                except OSError:
-                    pass
-
-            atexit.register(cleanup_temp_cert)
+            # Cleaned up on exit by the single module-level handler
+            _temp_cert_paths.add(temp_path)
 
         return self
 
@@ -319,35 +374,44 @@ class SymphonyConfig(BackendConfig):
         This is called automatically on process exit, but can be called
         manually for explicit cleanup.
         """
-        if self._temp_cert_path and os.path.exists(self._temp_cert_path):
-            try:
-                os.unlink(self._temp_cert_path)
-                object.__setattr__(self, "_temp_cert_path", None)
-            except OSError:
-                pass
+        path = self._temp_cert_path
+        if not path:
+            return
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+        except OSError:
+            return
+        _temp_cert_paths.discard(path)
+        object.__setattr__(self, "_temp_cert_path", None)
 
     @property
     def pod_url(self) -> str:
         """Build the pod URL."""
+        cached = self.__pydantic_private__["_pod_url_cache"]
+        if cached is not None and cached[0] is self.__dict__:
+            return cached[1]
         base = f"{self.scheme}://{self.host}"
         if self.port and self.port != 443:
             base += f":{self.port}"
         if self.context:
             base += f"/{self.context.strip('/')}"
+        self.__pydantic_private__["_pod_url_cache"] = (self.__dict__, base)
         return base
 
     def to_bdk_config(self) -> Dict[str, Any]:
         """Convert to Symphony BDK configuration format.
 
+        The result is built once and reused until a field is assigned, so
+        callers should treat it as read-only.
+
         Returns:
             Dictionary suitable for passing to SymphonyBdk.
         """
-        config: Dict[str, Any] = {
-            "host": self.host,
-            "port": self.port,
-            "scheme": self.scheme,
-            "context": self.context,
-        }
+        cached = self.__pydantic_private__["_bdk_config_cache"]
+        if cached is not None and cached[0] is self.__dict__:
+            return cached[1]
 
         # Bot configuration
         bot_config: Dict[str, Any] = {"username": self.bot_username}
@@ -363,7 +427,14 @@ class SymphonyConfig(BackendConfig):
                 cert_config["password"] = self.bot_certificate_password_str
             bot_config["certificate"] = cert_config
 
-        config["bot"] = bot_config
+        # Always-present keys are built in one literal; optional sections are added below
+        config: Dict[str, Any] = {
+            "host": self.host,
+            "port": self.port,
+            "scheme": self.scheme,
+            "context": self.context,
+            "bot": bot_config,
+        }
 
         # Pod configuration (only if explicitly set)
         if self.pod_host:
@@ -420,23 +491,28 @@ class SymphonyConfig(BackendConfig):
                 proxy_config["password"] = self.proxy_password_str
             config["proxy"] = proxy_config
 
+        self.__pydantic_private__["_bdk_config_cache"] = (self.__dict__, config)
         return config
 
     def _patch_ssl_verify(self) -> None:
         """Patch the BDK to disable SSL verification."""
-        try:
-            from symphony.bdk.gen.configuration import Configuration
+        if Configuration is None:
+            log.warning("Could not patch SSL verification: symphony-bdk-python is not installed")
+            return
+
+        # Patch once per process; re-wrapping per config would chain an extra frame onto every init
+        if getattr(Configuration, "_chatom_ssl_patched", False):
+            return
 
-            original_config_init = Configuration.__init__
+        original_config_init = Configuration.__init__
 
-            def patched_config_init(config_self, *args, **kwargs):
-                original_config_init(config_self, *args, **kwargs)
-                config_self.verify_ssl = False
+        def patched_config_init(config_self, *args, **kwargs):
+            original_config_init(config_self, *args, **kwargs)
+            config_self.verify_ssl = False
 
-            cast(Any, Configuration).__init__ = patched_config_init
-            log.debug("SSL verification has been disabled via monkey patch")
-        except ImportError as e:
-            log.warning(f"Could not patch SSL verification: {e}")
+        cast(Any, Configuration).__init__ = patched_config_init
+        cast(Any, Configuration)._chatom_ssl_patched = True
+        log.debug("SSL verification has been disabled via monkey patch")
 
     def get_bdk_config(self):
         """Build a BdkConfig from chatom config fields.
@@ -444,12 +520,9 @@ class SymphonyConfig(BackendConfig):
         Returns:
             A BdkConfig instance for use with symphony-bdk-python.
         """
-        try:
-            from symphony.bdk.core.config.model.bdk_config import BdkConfig
-
-            return BdkConfig(**self.to_bdk_config())
-        except ImportError:
+        if BdkConfig is None:
             raise ImportError("symphony-bdk-python is required for get_bdk_config()")
+        return BdkConfig(**self.to_bdk_config())
 
 
 class SymphonyRoomMapper:
@@ -470,7 +543,10 @@ class SymphonyRoomMapper:
         self._id_to_name: Dict[str, str] = {}
         self._stream_service = stream_service
         self._backend = backend
+        # Guards writes so both dicts change together; single-key reads do not take it
         self._lock = threading.Lock()
+        # In-flight async lookups, so concurrent misses on one key share a request
+        self._inflight: Dict[Tuple[str, str], "asyncio.Future[Optional[str]]"] = {}
 
     def set_stream_service(self, stream_service):
         """Set the stream service for room resolution."""
@@ -489,15 +565,16 @@ class SymphonyRoomMapper:
         Returns:
             The room's stream ID, or None if not found.
         """
-        with self._lock:
-            if room_name in self._name_to_id:
-                return self._name_to_id[room_name]
+        # A single dict.get is atomic, so cached reads skip the lock; it only pairs up writes
+        room_id = self._name_to_id.get(room_name)
+        if room_id is not None:
+            return room_id
 
-            # If it looks like a stream ID already, return it
-            if len(room_name) > 20 and " " not in room_name:
-                return room_name
+        # If it looks like a stream ID already, return it; this reads no shared state
+        if len(room_name) > 20 and " " not in room_name:
+            return room_name
 
-            return None
+        return None
 
     async def get_room_id_async(self, room_name: str) -> Optional[str]:
         """Get the room ID for a given room name, using async calls if needed.
@@ -512,7 +589,10 @@ class SymphonyRoomMapper:
         cached = self.get_room_id(room_name)
         if cached:
             return cached
+        return await _coalesce(self._inflight, ("id", room_name), lambda: self._resolve_room_id(room_name))
 
+    async def _resolve_room_id(self, room_name: str) -> Optional[str]:
+        """Look up a room ID that is not cached."""
         # Try chatom backend first
         if self._backend is not None:
             channel = await self._backend.fetch_channel(name=room_name)
@@ -527,21 +607,25 @@ class SymphonyRoomMapper:
             return None
 
         try:
-            from symphony.bdk.gen.pod_model.v2_room_search_criteria import V2RoomSearchCriteria
-
             results = await self._stream_service.search_rooms(V2RoomSearchCriteria(query=room_name), limit=10)
             if results and results.rooms:
+                found: Dict[str, str] = {}
                 for room in results.rooms:
                     room_attrs = room.room_attributes
                     room_info = room.room_system_info
-                    if room_attrs and room_info and room_attrs.name == room_name:
-                        room_id = room_info.id
-                        with self._lock:
-                            self._name_to_id[room_name] = room_id
-                            self._id_to_name[room_id] = room_name
-                        return room_id
+                    if room_attrs and room_info and room_attrs.name:
+                        found.setdefault(room_attrs.name, room_info.id)
+
+                # Cache the exact match, plus any other returned room that is not mapped yet;
+                # a fuzzy search must never rebind an existing mapping
+                with self._lock:
+                    for name, found_id in found.items():
+                        if name == room_name or (name not in self._name_to_id and found_id not in self._id_to_name):
+                            self._name_to_id[name] = found_id
+                            self._id_to_name[found_id] = name
+                return found.get(room_name)
         except Exception as e:
-            log.error(f"Error searching for room '{room_name}': {e}")
+            log.error("Error searching for room '%s': %s", room_name, e)
 
         return None
 
@@ -554,8 +638,7 @@ class SymphonyRoomMapper:
         Returns:
             The room's display name, or None if not found.
         """
-        with self._lock:
-            return self._id_to_name.get(room_id)
+        return self._id_to_name.get(room_id)
 
     async def get_room_name_async(self, room_id: str) -> Optional[str]:
         """Get the room name for a given room ID, using async calls if needed.
@@ -570,7 +653,10 @@ class SymphonyRoomMapper:
         cached = self.get_room_name(room_id)
         if cached:
             return cached
+        return await _coalesce(self._inflight, ("name", room_id), lambda: self._resolve_room_name(room_id))
 
+    async def _resolve_room_name(self, room_id: str) -> Optional[str]:
+        """Look up a room name that is not cached."""
         # Try chatom backend first
         if self._backend is not None:
             channel = await self._backend.fetch_channel(id=room_id)
@@ -593,7 +679,7 @@ class SymphonyRoomMapper:
                     self._id_to_name[room_id] = room_name
                 return room_name
         except Exception as e:
-            log.error(f"Error getting room info for '{room_id}': {e}")
+            log.error("Error getting room info for '%s': %s", room_id, e)
 
         return None
 
@@ -618,3 +704,16 @@ class SymphonyRoomMapper:
         with self._lock:
             self._name_to_id[room_name] = room_id
             self._id_to_name[room_id] = room_name
+
+    def register_rooms(self, rooms: Dict[str, str]):
+        """Register several room name to ID mappings at once.
+
+        Args:
+            rooms: Mapping of room display names to stream IDs.
+        """
+        if not rooms:
+            return
+        inverse = {room_id: room_name for room_name, room_id in rooms.items()}
+        with self._lock:
+            self._name_to_id.update(rooms)
+            self._id_to_name.update(inverse)
@@ -3,12 +3,21 @@
 This module registers Symphony-specific mention formatting using MessageML.
 """
 
+from functools import lru_cache
+
 from chatom.base import mention_user
 
 from .user import SymphonyUser
 
 __all__ = ("mention_user", "mention_user_by_email", "mention_user_by_uid")
 
+# MessageML tags are built by concatenation; they sit on the message render path
+_UID_MENTION_PREFIX = '<mention uid="'
+_EMAIL_MENTION_PREFIX = '<mention email="'
+_HASH_TAG_PREFIX = '<hash tag="'
+_CASH_TAG_PREFIX = '<cash tag="'
+_TAG_SUFFIX = '"/>'
+
 
 @mention_user.register
 def _mention_symphony_user(user: SymphonyUser) -> str:
@@ -23,12 +32,14 @@ def _mention_symphony_user(user: SymphonyUser) -> str:
         str: The Symphony MessageML mention tag.
     """
     if user.id:
-        return f'<mention uid="{user.id}"/>'
+        return mention_user_by_uid(user.id)
     elif user.email:
-        return f'<mention email="{user.email}"/>'
+        return mention_user_by_email(user.email)
     return f"@{user.display_name or user.name}"
 
 
+# The same users are mentioned over and over, so the tags are memoized per address / ID
+@lru_cache(maxsize=4096)
 def mention_user_by_email(email: str) -> str:
     """Generate a Symphony mention by email address.
 
@@ -38,9 +49,10 @@ def mention_user_by_email(email: str) -> str:
     Returns:
         str: The Symphony MessageML mention tag.
     """
-    return f'<mention email="{email}"/>'
+    return _EMAIL_MENTION_PREFIX + email + _TAG_SUFFIX
 
 
+@lru_cache(maxsize=4096)
 def mention_user_by_uid(uid: str) -> str:
     """Generate a Symphony mention by user ID.
 
@@ -50,7 +62,7 @@ def mention_user_by_uid(uid: str) -> str:
     Returns:
         str: The Symphony MessageML mention tag.
     """
-    return f'<mention uid="{uid}"/>'
+    return _UID_MENTION_PREFIX + str(uid) + _TAG_SUFFIX
 
 
 def format_hashtag(tag: str) -> str:
@@ -62,7 +74,7 @@ def format_hashtag(tag: str) -> str:
     Returns:
         str: The Symphony MessageML hash tag.
     """
-    return f'<hash tag="{tag}"/>'
+    return _HASH_TAG_PREFIX + tag + _TAG_SUFFIX
 
 
 def format_cashtag(tag: str) -> str:
@@ -74,4 +86,4 @@ def format_cashtag(tag: str) -> str:
     Returns:
         str: The Symphony MessageML cash tag.
     """
-    return f'<cash tag="{tag}"/>'
+    return _CASH_TAG_PREFIX + tag + _TAG_SUFFIX
@@ -4,17 +4,23 @@ This module provides the Symphony-specific Message class.
 """
 
 import html
-import json
 import re
 from datetime import datetime
 from enum import Enum
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, FrozenSet, List, Optional, Tuple
+
+from pydantic import PrivateAttr
 
 from chatom.base import Field, Message, User
 
 from .channel import SymphonyChannel
 from .user import SymphonyUser
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
 if TYPE_CHECKING:
     from chatom.format import FormattedMessage
 
@@ -23,6 +29,29 @@ __all__ = (
     "SymphonyMessageFormat",
 )
 
+# Entity type Symphony uses for user mentions in the message data field
+_USER_MENTION_TYPE = "com.symphony.user.mention"
+
+# Patterns for _parse_symphony_content, compiled once at import.
+# Tags that end a line, in the order they used to be replaced one pass at a time. Each pass
+# also swallowed whitespace after its tag, including newlines left by earlier passes, so a
+# tag absorbs any whitespace and earlier line-break tags that directly follow it.
+_LINE_BREAK_TAGS = (r"<br\s*/?>", r"</p>", r"</div>", r"</li>", r"</tr>")
+
+
+def _absorbing(tags) -> str:
+    """Build a pattern for a run of whitespace and the given tags."""
+    return "(?:" + "|".join((r"\s", *tags)) + ")*"
+
+
+_CELL_END_RE = re.compile(r"</t[dh]>" + _absorbing(_LINE_BREAK_TAGS), re.IGNORECASE)
+_LINE_BREAK_RE = re.compile(
+    "|".join(tag + _absorbing(_LINE_BREAK_TAGS[:rank]) for rank, tag in enumerate(_LINE_BREAK_TAGS)),
+    re.IGNORECASE,
+)
+_TAG_RE = re.compile(r"<[^>]+>")
+_BLANK_LINES_RE = re.compile(r"\n{3,}")
+
 
 class SymphonyMessageFormat(str, Enum):
     """Symphony message format types."""
@@ -114,6 +143,12 @@ class SymphonyMessage(Message):
         description="List of cashtags in the message.",
     )
 
+    # Caches below are accessed through __pydantic_private__ to skip the slow BaseModel.__getattr__ lookup
+    # Cached (rendered content, plain text) pair, so repeat conversions skip reparsing
+    _plain_text_cache: Optional[Tuple[str, str]] = PrivateAttr(default=None)
+    # Cached (data, mentioned user IDs) pair, so checking several users parses data once
+    _data_mentions_cache: Optional[Tuple[str, FrozenSet[int]]] = PrivateAttr(default=None)
+
     @property
     def is_shared_message(self) -> bool:
         """Check if this is a shared/forwarded message."""
@@ -165,7 +200,6 @@ class SymphonyMessage(Message):
             True if the user is mentioned in this message.
         """
         user_id_str = str(user.id)
-        user_id_int = int(user_id_str) if user_id_str.isdigit() else None
 
         # Check mentions (User objects from base class)
         for user in self.mentions:
@@ -173,20 +207,28 @@ class SymphonyMessage(Message):
                 return True
 
         # Check entity_data for mention entities
-        for key, entity in self.entity_data.items():
-            if isinstance(entity, dict) and entity.get("type") == "com.symphony.user.mention":
-                mentioned_id = entity.get("id", [{}])[0].get("value")
-                if mentioned_id and str(mentioned_id) == user_id_str:
-                    return True
+        if self.entity_data:
+            for entity in self.entity_data.values():
+                if isinstance(entity, dict) and entity.get("type") == _USER_MENTION_TYPE:
+                    mentioned_id = entity.get("id", [{}])[0].get("value")
+                    if mentioned_id and str(mentioned_id) == user_id_str:
+                        return True
 
         # Also check the data field (JSON string) if entity_data is empty
-        if self.data and not self.entity_data:
-            extracted = self.extract_mentions_from_data(self.data)
-            if user_id_int is not None and user_id_int in extracted:
+        if self.data and not self.entity_data and user_id_str.isdigit():
+            if int(user_id_str) in self._data_mention_ids(self.data):
                 return True
 
         return False
 
+    def _data_mention_ids(self, data: str) -> FrozenSet[int]:
+        """Get the user IDs mentioned in ``data``, parsing each data string once."""
+        private = self.__pydantic_private__
+        cached = private["_data_mentions_cache"]
+        if cached is None or cached[0] != data:
+            cached = private["_data_mentions_cache"] = (data, frozenset(self.extract_mentions_from_data(data)))
+        return cached[1]
+
     @staticmethod
     def extract_mentions_from_data(data: Optional[str]) -> List[int]:
         """Extract user IDs from Symphony data field (JSON entity data).
@@ -200,21 +242,17 @@ class SymphonyMessage(Message):
         Returns:
             List of user IDs (as integers) mentioned in the message.
         """
-        if not data:
+        # Skip the JSON parse when no mention entity can be present
+        if not data or _USER_MENTION_TYPE not in data:
             return []
 
         try:
-            entities = json.loads(data)
-            mentions = []
-            for key, entity in entities.items():
-                if isinstance(entity, dict) and entity.get("type") == "com.symphony.user.mention":
-                    id_list = entity.get("id", [])
-                    if id_list and isinstance(id_list, list) and len(id_list) > 0:
-                        user_id = id_list[0].get("value")
-                        if user_id:
-                            mentions.append(int(user_id))
-            return mentions
-        except (json.JSONDecodeError, ValueError, TypeError):
+            id_lists = [
+                entity.get("id") for entity in _json_loads(data).values() if isinstance(entity, dict) and entity.get("type") == _USER_MENTION_TYPE
+            ]
+            user_ids = [id_list[0].get("value") for id_list in id_lists if id_list and isinstance(id_list, list)]
+            return [int(user_id) for user_id in user_ids if user_id]
+        except (AttributeError, ValueError, TypeError):  # malformed entities; JSONDecodeError subclasses ValueError
             return []
 
     @property
@@ -237,19 +275,12 @@ class SymphonyMessage(Message):
         if not content:
             return ""
 
-        text = content
-
-        # Replace common block elements with newlines
-        text = re.sub(r"<br\s*/?>\s*", "\n", text, flags=re.IGNORECASE)
-        text = re.sub(r"</p>\s*", "\n", text, flags=re.IGNORECASE)
-        text = re.sub(r"</div>\s*", "\n", text, flags=re.IGNORECASE)
-        text = re.sub(r"</li>\s*", "\n", text, flags=re.IGNORECASE)
-        text = re.sub(r"</tr>\s*", "\n", text, flags=re.IGNORECASE)
-        text = re.sub(r"</td>\s*", " | ", text, flags=re.IGNORECASE)
-        text = re.sub(r"</th>\s*", " | ", text, flags=re.IGNORECASE)
+        # Separate table cells, then replace common block elements with newlines
+        text = _CELL_END_RE.sub(" | ", content)
+        text = _LINE_BREAK_RE.sub("\n", text)
 
         # Remove all remaining HTML/XML tags
-        text = re.sub(r"<[^>]+>", "", text)
+        text = _TAG_RE.sub("", text)
 
         # Decode HTML entities
         text = html.unescape(text)
@@ -260,16 +291,20 @@ class SymphonyMessage(Message):
         text = "\n".join(lines)
 
         # Remove excessive blank lines
-        text = re.sub(r"\n{3,}", "\n\n", text)
+        text = _BLANK_LINES_RE.sub("\n\n", text)
 
         return text.strip()
 
     @classmethod
-    def from_api_response(cls, data: Dict[str, Any]) -> "SymphonyMessage":
+    def from_api_response(cls, data: Dict[str, Any], *, validate: bool = False) -> "SymphonyMessage":
         """Create a SymphonyMessage from an API response.
 
+        The payload comes straight from the Symphony API, so by default the
+        outer message is built with ``model_construct`` to skip revalidation.
+
         Args:
             data: The API response data.
+            validate: Run full model validation instead, e.g. in tests.
 
         Returns:
             A SymphonyMessage instance.
@@ -277,13 +312,15 @@ class SymphonyMessage(Message):
         user_data = data.get("user", {})
         stream_data = data.get("stream", {})
         timestamp = data.get("timestamp")
+        message_ml = data.get("message", "")
+        build = cls if validate else cls.model_construct
 
-        return cls(
+        return build(
             id=data.get("messageId", ""),
             channel=SymphonyChannel(id=stream_data.get("streamId", "")),
-            content=data.get("message", ""),
-            message_ml=data.get("message", ""),
-            formatted_content=data.get("message", ""),
+            content=message_ml,
+            message_ml=message_ml,
+            formatted_content=message_ml,
             author=SymphonyUser(id=str(user_data.get("userId", ""))),
             created_at=datetime.fromtimestamp(timestamp / 1000) if timestamp else None,
             data=data.get("data"),
@@ -309,9 +346,12 @@ class SymphonyMessage(Message):
         # Use rendered content (PresentationML > MessageML > content)
         content = self.rendered_content
         if content:
-            # Parse the MessageML/PresentationML to extract plain text and formatting
-            plain_text = self._parse_symphony_content(content)
-            fm.add_text(plain_text)
+            # Parse the MessageML/PresentationML to extract plain text, reusing the last parse
+            private = self.__pydantic_private__
+            cached = private["_plain_text_cache"]
+            if cached is None or cached[0] != content:
+                cached = private["_plain_text_cache"] = (content, self._parse_symphony_content(content))
+            fm.add_text(cached[1])
 
         # Add attachment metadata
         for att_meta in self.attachments_metadata:
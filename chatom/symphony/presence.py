@@ -25,6 +25,20 @@ class SymphonyPresenceStatus(str, Enum):
     OFFLINE = "OFFLINE"
 
 
+# Map Symphony status to base PresenceStatus
+_STATUS_TO_BASE_STATUS = {
+    SymphonyPresenceStatus.AVAILABLE: PresenceStatus.ONLINE,
+    SymphonyPresenceStatus.BUSY: PresenceStatus.DND,
+    SymphonyPresenceStatus.ON_THE_PHONE: PresenceStatus.DND,
+    SymphonyPresenceStatus.IN_A_MEETING: PresenceStatus.DND,
+    SymphonyPresenceStatus.AWAY: PresenceStatus.IDLE,
+    SymphonyPresenceStatus.BE_RIGHT_BACK: PresenceStatus.IDLE,
+    SymphonyPresenceStatus.OUT_OF_OFFICE: PresenceStatus.IDLE,
+    SymphonyPresenceStatus.OFF_WORK: PresenceStatus.OFFLINE,
+    SymphonyPresenceStatus.OFFLINE: PresenceStatus.OFFLINE,
+}
+
+
 class SymphonyPresence(Presence):
     """Symphony-specific presence.
 
@@ -54,15 +68,4 @@ class SymphonyPresence(Presence):
         Returns:
             PresenceStatus: The generic presence status.
         """
-        status_map = {
-            SymphonyPresenceStatus.AVAILABLE: PresenceStatus.ONLINE,
-            SymphonyPresenceStatus.BUSY: PresenceStatus.DND,
-            SymphonyPresenceStatus.ON_THE_PHONE: PresenceStatus.DND,
-            SymphonyPresenceStatus.IN_A_MEETING: PresenceStatus.DND,
-            SymphonyPresenceStatus.AWAY: PresenceStatus.IDLE,
-            SymphonyPresenceStatus.BE_RIGHT_BACK: PresenceStatus.IDLE,
-            SymphonyPresenceStatus.OUT_OF_OFFICE: PresenceStatus.IDLE,
-            SymphonyPresenceStatus.OFF_WORK: PresenceStatus.OFFLINE,
-            SymphonyPresenceStatus.OFFLINE: PresenceStatus.OFFLINE,
-        }
-        return status_map.get(self.symphony_status, PresenceStatus.UNKNOWN)
+        return _STATUS_TO_BASE_STATUS.get(self.symphony_status, PresenceStatus.UNKNOWN)
@@ -4,9 +4,13 @@ This module provides a mock implementation of the Symphony backend
 that doesn't require actual Symphony servers.
 """
 
-import uuid
+import heapq
+import secrets
+from bisect import bisect_left, insort
 from datetime import datetime, timezone
-from typing import Any, ClassVar, Dict, List, Optional, Union
+from itertools import pairwise
+from operator import itemgetter
+from typing import Any, ClassVar, Dict, List, Optional, Tuple, Union
 
 from pydantic import Field
 
@@ -18,6 +22,7 @@ from ..base import (
     Message,
     MessageType,
     Presence,
+    PresenceStatus,
     User,
 )
 from ..format.variant import Format
@@ -25,11 +30,25 @@ from .channel import SymphonyChannel
 from .config import SymphonyConfig
 from .mention import mention_user as _mention_user
 from .message import SymphonyMessage
-from .presence import SymphonyPresence, SymphonyPresenceStatus
+from .presence import _STATUS_TO_BASE_STATUS, SymphonyPresence, SymphonyPresenceStatus
 from .user import SymphonyUser
 
 __all__ = ("MockSymphonyBackend",)
 
+# Sort key for stored mock messages
+_message_timestamp = itemgetter("timestamp")
+
+# Map presence statuses accepted by set_presence
+_PRESENCE_MAP = {
+    "available": SymphonyPresenceStatus.AVAILABLE,
+    "online": SymphonyPresenceStatus.AVAILABLE,
+    "busy": SymphonyPresenceStatus.BUSY,
+    "dnd": SymphonyPresenceStatus.BUSY,
+    "away": SymphonyPresenceStatus.AWAY,
+    "idle": SymphonyPresenceStatus.AWAY,
+    "offline": SymphonyPresenceStatus.OFFLINE,
+}
+
 
 class MockSymphonyBackend(BackendBase):
     """Mock Symphony backend for testing.
@@ -39,8 +58,12 @@ class MockSymphonyBackend(BackendBase):
 
     Attributes:
         mock_users: Dictionary of mock users by ID.
+        mock_users_by_email: Mock user IDs by email address.
+        mock_users_by_name_lower: Mock user IDs by lowercased display name and username.
         mock_streams: Dictionary of mock streams (channels) by ID.
+        mock_streams_by_name_lower: Mock stream IDs by lowercased name.
         mock_messages: Dictionary of messages by stream ID.
+        mock_messages_by_id: The same messages by stream ID, then message ID.
         mock_presence: Dictionary of presence by user ID.
         sent_messages: List of sent messages for verification.
         edited_messages: List of edited message IDs.
@@ -68,8 +91,12 @@ class MockSymphonyBackend(BackendBase):
 
     # Mock data stores
     mock_users: Dict[str, Dict[str, Any]] = Field(default_factory=dict)
+    mock_users_by_email: Dict[str, str] = Field(default_factory=dict)
+    mock_users_by_name_lower: Dict[str, str] = Field(default_factory=dict)
     mock_streams: Dict[str, Dict[str, Any]] = Field(default_factory=dict)
+    mock_streams_by_name_lower: Dict[str, str] = Field(default_factory=dict)
     mock_messages: Dict[str, List[Dict[str, Any]]] = Field(default_factory=dict)
+    mock_messages_by_id: Dict[str, Dict[str, Dict[str, Any]]] = Field(default_factory=dict)
     mock_presence: Dict[str, SymphonyPresenceStatus] = Field(default_factory=dict)
 
     # Tracking for verification
@@ -83,6 +110,9 @@ class MockSymphonyBackend(BackendBase):
     # Mock bot info
     _mock_bot_user_id: int = 999999999
 
+    # Message lists known to be oldest first, with their length when last checked
+    _ordered_streams: Dict[str, Tuple[List[Dict[str, Any]], int]] = {}
+
     class Config:
         """Pydantic config."""
 
@@ -103,12 +133,34 @@ class MockSymphonyBackend(BackendBase):
             username: The user's username.
             email: The user's email address.
         """
-        self.mock_users[str(user_id)] = {
+        uid = str(user_id)
+        replaced = uid in self.mock_users
+        data = {
             "id": user_id,
             "display_name": display_name,
             "username": username,
             "email": email or f"{username}@example.com",
         }
+        self.mock_users[uid] = data
+
+        if replaced:
+            # The old values may be shared with other users, so rebuild rather than delete keys
+            self._reindex_mock_users()
+        else:
+            self._index_mock_user(uid, data)
+
+    def _index_mock_user(self, uid: str, data: Dict[str, Any]) -> None:
+        """Add a mock user to the search indexes; the first user added with a key wins."""
+        self.mock_users_by_email.setdefault(data["email"], uid)
+        self.mock_users_by_name_lower.setdefault(data["display_name"].lower(), uid)
+        self.mock_users_by_name_lower.setdefault(data["username"].lower(), uid)
+
+    def _reindex_mock_users(self) -> None:
+        """Rebuild the user search indexes from mock_users."""
+        self.mock_users_by_email.clear()
+        self.mock_users_by_name_lower.clear()
+        for uid, data in self.mock_users.items():
+            self._index_mock_user(uid, data)
 
     def add_mock_stream(
         self,
@@ -123,11 +175,21 @@ class MockSymphonyBackend(BackendBase):
             name: The stream name.
             stream_type: The stream type (ROOM, IM, MIM).
         """
+        replaced = stream_id in self.mock_streams
         self.mock_streams[stream_id] = {
             "id": stream_id,
             "name": name,
             "type": stream_type,
         }
+
+        # Searches return the first stream added with a matching name
+        if replaced:
+            # The old name may be shared with another stream, so rebuild rather than delete it
+            self.mock_streams_by_name_lower.clear()
+            for sid, data in self.mock_streams.items():
+                self.mock_streams_by_name_lower.setdefault(data["name"].lower(), sid)
+        else:
+            self.mock_streams_by_name_lower.setdefault(name.lower(), stream_id)
         if stream_id not in self.mock_messages:
             self.mock_messages[stream_id] = []
 
@@ -151,11 +213,8 @@ class MockSymphonyBackend(BackendBase):
         Returns:
             The message ID.
         """
-        if stream_id not in self.mock_messages:
-            self.mock_messages[stream_id] = []
-
         if message_id is None:
-            message_id = str(uuid.uuid4())
+            message_id = secrets.token_hex(16)
 
         if timestamp is None:
             timestamp = datetime.now(timezone.utc)
@@ -167,9 +226,52 @@ class MockSymphonyBackend(BackendBase):
             "timestamp": timestamp,
             "stream_id": stream_id,
         }
-        self.mock_messages[stream_id].append(msg)
+        self._store_mock_message(stream_id, msg)
         return message_id
 
+    def _store_mock_message(self, stream_id: str, msg: Dict[str, Any]) -> None:
+        """Insert a message into a stream in time order and index it by message ID."""
+        messages = self.mock_messages.setdefault(stream_id, [])
+        if self._is_ordered(stream_id, messages):
+            # Inserted after any message with the same timestamp, keeping ties in stored order
+            insort(messages, msg, key=_message_timestamp)
+            self._ordered_streams[stream_id] = (messages, len(messages))
+        else:
+            messages.append(msg)
+        # Edits and deletes look up the first message stored with an ID
+        self.mock_messages_by_id.setdefault(stream_id, {}).setdefault(msg["message_id"], msg)
+
+    def _is_ordered(self, stream_id: str, messages: List[Dict[str, Any]]) -> bool:
+        """Check whether a stream's messages are stored oldest first.
+
+        Lists only written through this backend are known to be ordered. A list
+        assigned or appended to directly is checked once and remembered if ordered.
+        """
+        record = self._ordered_streams.get(stream_id)
+        if record is not None and record[0] is messages and record[1] == len(messages):
+            return True
+        if all(a["timestamp"] <= b["timestamp"] for a, b in pairwise(messages)):
+            self._ordered_streams[stream_id] = (messages, len(messages))
+            return True
+        return False
+
+    def _find_mock_message(self, stream_id: str, message_id: str) -> Optional[Dict[str, Any]]:
+        """Return a stored message by ID, checking the index entry is still in the stream."""
+        messages = self.mock_messages.get(stream_id, [])
+        msg = self.mock_messages_by_id.get(stream_id, {}).get(message_id)
+        if msg is not None and msg["message_id"] == message_id:
+            if self._is_ordered(stream_id, messages):
+                # Only the run of messages sharing its timestamp can hold it
+                i = bisect_left(messages, msg["timestamp"], key=_message_timestamp)
+                while i < len(messages) and messages[i]["timestamp"] == msg["timestamp"]:
+                    if messages[i] is msg:
+                        return msg
+                    i += 1
+            elif any(m is msg for m in messages):
+                return msg
+        # Not indexed, or the indexed message was replaced or removed directly
+        return next((m for m in messages if m["message_id"] == message_id), None)
+
     def set_mock_presence(
         self,
         user_id: str,
@@ -194,6 +296,24 @@ class MockSymphonyBackend(BackendBase):
         """Disconnect from mock Symphony."""
         self.connected = False
 
+    def _get_mock_user(self, id: str) -> Optional[SymphonyUser]:
+        """Return the cached or mock user with the given ID, if any."""
+        cached = self.users.get_by_id(id)
+        if cached:
+            return cached
+
+        data = self.mock_users.get(id)
+        if data is None:
+            return None
+        user = SymphonyUser(
+            id=str(data["id"]),
+            name=data["display_name"],
+            handle=data["username"],
+            email=data["email"],
+        )
+        self.users.add(user)
+        return user
+
     async def fetch_user(
         self,
         identifier: Optional[Union[str, User]] = None,
@@ -218,47 +338,60 @@ class MockSymphonyBackend(BackendBase):
         # Handle User object input
         if isinstance(identifier, SymphonyUser):
             return identifier
-        if hasattr(identifier, "id") and identifier is not None:
+        if isinstance(identifier, User):
             id = str(identifier.id)
-
         # Resolve identifier to id
-        if identifier and not id:
+        elif identifier and not id:
             id = str(identifier)
 
-        # Check cache first
+        # Check cache, then mock data
         if id:
-            cached = self.users.get_by_id(id)
-            if cached:
-                return cached
-
-            # Check mock data
-            if id in self.mock_users:
-                data = self.mock_users[id]
-                user = SymphonyUser(
-                    id=str(data["id"]),
-                    name=data["display_name"],
-                    handle=data["username"],
-                    email=data["email"],
-                )
-                self.users.add(user)
+            user = self._get_mock_user(id)
+            if user:
                 return user
 
         # Search by email
         if email:
-            for uid, data in self.mock_users.items():
-                if data.get("email") == email:
-                    return await self.fetch_user(uid)
+            uid = self.mock_users_by_email.get(email)
+            data = self.mock_users.get(uid) if uid is not None else None
+            if data is None or data.get("email") != email:
+                # Users written straight into mock_users are not indexed
+                uid = next((u for u, d in self.mock_users.items() if d.get("email") == email), None)
+            if uid is not None:
+                return self._get_mock_user(uid)
 
         # Search by name or handle
         search_term = name or handle
         if search_term:
             search_lower = search_term.lower()
-            for uid, data in self.mock_users.items():
-                if data["display_name"].lower() == search_lower or data["username"].lower() == search_lower:
-                    return await self.fetch_user(uid)
+            uid = self.mock_users_by_name_lower.get(search_lower)
+            data = self.mock_users.get(uid) if uid is not None else None
+            if data is None or search_lower not in (data["display_name"].lower(), data["username"].lower()):
+                uid = next(
+                    (u for u, d in self.mock_users.items() if d["display_name"].lower() == search_lower or d["username"].lower() == search_lower),
+                    None,
+                )
+            if uid is not None:
+                return self._get_mock_user(uid)
 
         return None
 
+    def _get_mock_channel(self, id: str) -> Optional[SymphonyChannel]:
+        """Return the cached or mock channel with the given stream ID, if any."""
+        cached = self.channels.get_by_id(id)
+        if cached:
+            return cached
+
+        data = self.mock_streams.get(id)
+        if data is None:
+            return None
+        channel = SymphonyChannel(
+            id=id,
+            name=data["name"],
+        )
+        self.channels.add(channel)
+        return channel
+
     async def fetch_channel(
         self,
         identifier: Optional[Union[str, Channel]] = None,
@@ -279,35 +412,28 @@ class MockSymphonyBackend(BackendBase):
         # Handle Channel object input
         if isinstance(identifier, SymphonyChannel):
             return identifier
-        if hasattr(identifier, "id") and identifier is not None:
+        if isinstance(identifier, Channel):
             id = str(identifier.id)
-
         # Resolve identifier to id
-        if identifier and not id:
+        elif identifier and not id:
             id = str(identifier)
 
-        # Check cache first
+        # Check cache, then mock data
         if id:
-            cached = self.channels.get_by_id(id)
-            if cached:
-                return cached
-
-            # Check mock data
-            if id in self.mock_streams:
-                data = self.mock_streams[id]
-                channel = SymphonyChannel(
-                    id=id,
-                    name=data["name"],
-                )
-                self.channels.add(channel)
+            channel = self._get_mock_channel(id)
+            if channel:
                 return channel
 
         # Search by name
         if name:
             name_lower = name.lower()
-            for sid, data in self.mock_streams.items():
-                if data["name"].lower() == name_lower:
-                    return await self.fetch_channel(sid)
+            sid = self.mock_streams_by_name_lower.get(name_lower)
+            data = self.mock_streams.get(sid) if sid is not None else None
+            if data is None or data["name"].lower() != name_lower:
+                # Streams written straight into mock_streams are not indexed
+                sid = next((s for s, d in self.mock_streams.items() if d["name"].lower() == name_lower), None)
+            if sid is not None:
+                return self._get_mock_channel(sid)
 
         return None
 
@@ -334,21 +460,30 @@ class MockSymphonyBackend(BackendBase):
             return []
 
         messages_data = self.mock_messages[channel_id]
-
-        # Filter by timestamp if specified
-        filtered = messages_data
-        if before:
-            before_ts = int(before)
-            before_dt = datetime.fromtimestamp(before_ts / 1000, tz=timezone.utc)
-            filtered = [m for m in filtered if m["timestamp"] < before_dt]
-        if after:
-            after_ts = int(after)
-            after_dt = datetime.fromtimestamp(after_ts / 1000, tz=timezone.utc)
-            filtered = [m for m in filtered if m["timestamp"] >= after_dt]
-
-        # Sort by timestamp (newest first) and limit
-        filtered = sorted(filtered, key=lambda m: m["timestamp"], reverse=True)
-        filtered = filtered[:limit]
+        before_dt = datetime.fromtimestamp(int(before) / 1000, tz=timezone.utc) if before else None
+        after_dt = datetime.fromtimestamp(int(after) / 1000, tz=timezone.utc) if after else None
+
+        if self._is_ordered(channel_id, messages_data):
+            # Find the timestamp window by bisection
+            lo, hi = 0, len(messages_data)
+            if before_dt is not None:
+                hi = bisect_left(messages_data, before_dt, key=_message_timestamp)
+            if after_dt is not None:
+                lo = bisect_left(messages_data, after_dt, key=_message_timestamp)
+
+            # Newest first, limited. Widen the tail to the whole run of messages sharing its
+            # oldest timestamp so ties keep their stored order, as a full stable sort would
+            start = max(lo, hi - limit)
+            if start < hi:
+                start = bisect_left(messages_data, messages_data[start]["timestamp"], lo, start, key=_message_timestamp)
+            filtered = sorted(messages_data[start:hi], key=_message_timestamp, reverse=True)[:limit]
+        else:
+            # Messages written directly out of time order: select the newest in the window with
+            # a bounded heap, which keeps ties in stored order like a full stable sort
+            in_window = (
+                m for m in messages_data if (before_dt is None or m["timestamp"] < before_dt) and (after_dt is None or m["timestamp"] >= after_dt)
+            )
+            filtered = heapq.nlargest(limit, in_window, key=_message_timestamp)
 
         messages: List[Message] = []
         for raw in filtered:
@@ -386,7 +521,7 @@ class MockSymphonyBackend(BackendBase):
         kwargs.pop("thread", None)
         kwargs.pop("reply_to", None)
 
-        message_id = str(uuid.uuid4())
+        message_id = secrets.token_hex(16)
         timestamp = datetime.now(timezone.utc)
 
         # Track sent message
@@ -401,19 +536,18 @@ class MockSymphonyBackend(BackendBase):
         self.sent_messages.append(sent)
 
         # Also add to mock messages
-        if channel_id not in self.mock_messages:
-            self.mock_messages[channel_id] = []
-        self.mock_messages[channel_id].append(
+        self._store_mock_message(
+            channel_id,
             {
                 "message_id": message_id,
                 "user_id": self._mock_bot_user_id,
                 "content": content,
                 "timestamp": timestamp,
                 "stream_id": channel_id,
-            }
+            },
         )
 
-        return SymphonyMessage(
+        return SymphonyMessage.model_construct(
             id=message_id,
             content=content,
             created_at=timestamp,
@@ -460,13 +594,11 @@ class MockSymphonyBackend(BackendBase):
         )
 
         # Update in mock messages
-        if channel_id in self.mock_messages:
-            for msg in self.mock_messages[channel_id]:
-                if msg["message_id"] == message_id:
-                    msg["content"] = content
-                    break
+        msg = self._find_mock_message(channel_id, message_id)
+        if msg is not None:
+            msg["content"] = content
 
-        return SymphonyMessage(
+        return SymphonyMessage.model_construct(
             id=message_id,
             content=content,
             created_at=timestamp,
@@ -496,8 +628,13 @@ class MockSymphonyBackend(BackendBase):
         self.deleted_messages.append(message_id)
 
         # Remove from mock messages
+        self.mock_messages_by_id.get(channel_id, {}).pop(message_id, None)
         if channel_id in self.mock_messages:
-            self.mock_messages[channel_id] = [m for m in self.mock_messages[channel_id] if m["message_id"] != message_id]
+            messages = self.mock_messages[channel_id]
+            ordered = self._is_ordered(channel_id, messages)
+            messages = self.mock_messages[channel_id] = [m for m in messages if m["message_id"] != message_id]
+            if ordered:
+                self._ordered_streams[channel_id] = (messages, len(messages))
 
     async def forward_message(
         self,
@@ -547,7 +684,7 @@ class MockSymphonyBackend(BackendBase):
         forwarded_content = "<messageML>" + "".join(content_parts) + "</messageML>"
 
         # Create the forwarded message
-        message_id = str(uuid.uuid4())
+        message_id = secrets.token_hex(16)
         timestamp = datetime.now(timezone.utc)
 
         forwarded_msg = SymphonyMessage(
@@ -572,9 +709,8 @@ class MockSymphonyBackend(BackendBase):
         }
         self.sent_messages.append(sent)
 
-        if dest_channel_id not in self.mock_messages:
-            self.mock_messages[dest_channel_id] = []
-        self.mock_messages[dest_channel_id].append(
+        self._store_mock_message(
+            dest_channel_id,
             {
                 "message_id": message_id,
                 "stream_id": dest_channel_id,
@@ -582,7 +718,7 @@ class MockSymphonyBackend(BackendBase):
                 "content": message.content,
                 "formatted_content": forwarded_content,
                 "timestamp": timestamp,
-            }
+            },
         )
 
         return forwarded_msg
@@ -600,18 +736,7 @@ class MockSymphonyBackend(BackendBase):
             status_text: Not used in Symphony.
             **kwargs: Additional options.
         """
-        # Map status
-        status_map = {
-            "available": SymphonyPresenceStatus.AVAILABLE,
-            "online": SymphonyPresenceStatus.AVAILABLE,
-            "busy": SymphonyPresenceStatus.BUSY,
-            "dnd": SymphonyPresenceStatus.BUSY,
-            "away": SymphonyPresenceStatus.AWAY,
-            "idle": SymphonyPresenceStatus.AWAY,
-            "offline": SymphonyPresenceStatus.OFFLINE,
-        }
-
-        mapped_status = status_map.get(status.lower(), SymphonyPresenceStatus.AVAILABLE)
+        mapped_status = _PRESENCE_MAP.get(status.lower(), SymphonyPresenceStatus.AVAILABLE)
 
         # Track change
         self.presence_changes.append(
@@ -637,25 +762,11 @@ class MockSymphonyBackend(BackendBase):
         user_id = user.id if isinstance(user, User) else str(user)
         symphony_status = self.mock_presence.get(user_id, SymphonyPresenceStatus.OFFLINE)
 
-        # Map Symphony status to base PresenceStatus
-        from ..base import PresenceStatus
-        from .user import SymphonyUser
-
-        status_map = {
-            SymphonyPresenceStatus.AVAILABLE: PresenceStatus.ONLINE,
-            SymphonyPresenceStatus.BUSY: PresenceStatus.DND,
-            SymphonyPresenceStatus.AWAY: PresenceStatus.IDLE,
-            SymphonyPresenceStatus.ON_THE_PHONE: PresenceStatus.DND,
-            SymphonyPresenceStatus.BE_RIGHT_BACK: PresenceStatus.IDLE,
-            SymphonyPresenceStatus.IN_A_MEETING: PresenceStatus.DND,
-            SymphonyPresenceStatus.OUT_OF_OFFICE: PresenceStatus.IDLE,
-            SymphonyPresenceStatus.OFF_WORK: PresenceStatus.OFFLINE,
-            SymphonyPresenceStatus.OFFLINE: PresenceStatus.OFFLINE,
-        }
-        base_status = status_map.get(symphony_status, PresenceStatus.UNKNOWN)
+        base_status = _STATUS_TO_BASE_STATUS.get(symphony_status, PresenceStatus.UNKNOWN)
 
+        # The status values are already typed, so skip revalidation
         user = SymphonyUser(id=user_id)
-        return SymphonyPresence(
+        return SymphonyPresence.model_construct(
             user=user,
             status=base_status,
             symphony_status=symphony_status,
@@ -730,7 +841,7 @@ class MockSymphonyBackend(BackendBase):
         user_ids = [u.id if isinstance(u, User) else str(u) for u in users]
         int_ids = [int(uid) for uid in user_ids]
         self.created_ims.append(int_ids)
-        stream_id = f"im_{uuid.uuid4()}"
+        stream_id = f"im_{secrets.token_hex(16)}"
         self.add_mock_stream(stream_id, f"IM with {len(users)} users", "IM")
         return stream_id
 
@@ -766,7 +877,7 @@ class MockSymphonyBackend(BackendBase):
         Returns:
             The stream ID.
         """
-        stream_id = f"room_{uuid.uuid4()}"
+        stream_id = f"room_{secrets.token_hex(16)}"
         self.created_rooms.append(
             {
                 "stream_id": stream_id,
@@ -807,8 +918,13 @@ class MockSymphonyBackend(BackendBase):
         Useful for cleaning up between tests.
         """
         self.mock_users.clear()
+        self.mock_users_by_email.clear()
+        self.mock_users_by_name_lower.clear()
         self.mock_streams.clear()
+        self.mock_streams_by_name_lower.clear()
         self.mock_messages.clear()
+        self.mock_messages_by_id.clear()
+        self._ordered_streams.clear()
         self.mock_presence.clear()
         self.sent_messages.clear()
         self.edited_messages.clear()
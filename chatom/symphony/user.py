@@ -3,7 +3,9 @@
 This module provides the Symphony-specific User class.
 """
 
-from typing import List
+from typing import List, Optional, Tuple
+
+from pydantic import PrivateAttr
 
 from chatom.base import Field, User
 
@@ -72,6 +74,30 @@ class SymphonyUser(User):
         description="List of user roles.",
     )
 
+    # Cached (id, int(id)) pair for the Symphony API, which takes integer user IDs
+    _id_int_cache: Optional[Tuple[str, Optional[int]]] = PrivateAttr(default=None)
+
+    @property
+    def user_id_int(self) -> Optional[int]:
+        """Get the user ID as an integer for Symphony API calls.
+
+        The conversion is cached and recomputed only if ``id`` changes.
+
+        Returns:
+            Optional[int]: The numeric user ID, or None if the ID is not numeric.
+        """
+        # Go through __pydantic_private__ directly; self._id_int_cache would route every read
+        # through BaseModel.__getattr__, which costs more than the int() this cache saves
+        private = self.__pydantic_private__
+        cached = private["_id_int_cache"]
+        if cached is None or cached[0] != self.id:
+            try:
+                value: Optional[int] = int(self.id)
+            except ValueError:
+                value = None
+            cached = private["_id_int_cache"] = (self.id, value)
+        return cached[1]
+
     @property
     def full_name(self) -> str:
         """Get the user's full name.
@@ -79,8 +105,10 @@ class SymphonyUser(User):
         Returns:
             str: First and last name combined.
         """
-        parts = [self.first_name, self.last_name]
-        return " ".join(p for p in parts if p) or self.display_name or self.name
+        first, last = self.first_name, self.last_name
+        if first and last:
+            return first + " " + last
+        return first or last or self.display_name or self.name
 
     @property
     def mention_name(self) -> str:
@@ -57,6 +57,33 @@ class TestSymphonyMessageConversion:
         assert msg.channel_id == "stream_xyz"
         assert msg.author_id == "12345"
         assert msg.backend == "symphony"
+        assert SymphonyMessage.from_api_response(data, validate=True).model_dump() == msg.model_dump()
+
+    def test_parse_symphony_content_tables_and_breaks(self):
+        """Test block and cell tags collapse to the same text as before the passes were merged."""
+        from chatom.symphony import SymphonyMessage
+
+        msg = SymphonyMessage(id="m1")
+        table = "<table><tr><td>a</td> <td>b</td></tr>\n<tr><th>c</th><td>d</td></tr></table>"
+        assert msg._parse_symphony_content(table) == "a | b | c | d |"
+        breaks = "<div><p>one</p><br/>\n<p>two</p></div><br><br><br>three &amp; four"
+        assert msg._parse_symphony_content(breaks) == "one\ntwo\n\nthree & four"
+
+    def test_to_formatted_reuses_parsed_text(self):
+        """Test repeat conversions reuse the parsed text until the content changes."""
+        from unittest.mock import patch
+
+        from chatom.format import Format
+        from chatom.symphony import SymphonyMessage
+
+        msg = SymphonyMessage(id="m1", presentation_ml="<div>Hello <b>there</b></div>")
+        with patch.object(SymphonyMessage, "_parse_symphony_content", wraps=msg._parse_symphony_content) as parse:
+            assert msg.to_formatted().render(Format.PLAINTEXT) == msg.to_formatted().render(Format.PLAINTEXT) == "Hello there"
+            assert parse.call_count == 1
+
+            msg.presentation_ml = "<div>Bye</div>"
+            assert msg.to_formatted().render(Format.PLAINTEXT) == "Bye"
+            assert parse.call_count == 2
 
 
 class TestSymphonyMessageProperties:
@@ -235,6 +262,25 @@ class TestSymphonyMentionsUser:
         assert msg.mentions_user(SymphonyUser(id="12345")) is True
         assert msg.mentions_user(SymphonyUser(id="99999")) is False
 
+    def test_mentions_user_parses_data_once(self):
+        """Test checking several users against the data field parses it once per data value."""
+        import json
+        from unittest.mock import patch
+
+        from chatom.symphony import SymphonyMessage
+
+        def mention(uid):
+            return json.dumps({"mention0": {"type": "com.symphony.user.mention", "id": [{"value": uid}]}})
+
+        msg = SymphonyMessage(id="m1", data=mention("1"))
+        with patch.object(SymphonyMessage, "extract_mentions_from_data", wraps=SymphonyMessage.extract_mentions_from_data) as extract:
+            assert [msg.mentions_user(SymphonyUser(id=uid)) for uid in ("1", "2", "3")] == [True, False, False]
+            assert extract.call_count == 1
+
+            msg.data = mention("2")
+            assert msg.mentions_user(SymphonyUser(id="2")) is True
+            assert extract.call_count == 2
+
     def test_mentions_user_with_non_numeric_id(self):
         """Test mentions_user handles non-numeric user IDs gracefully."""
         from chatom.symphony import SymphonyMessage
@@ -276,6 +276,17 @@ class TestSymphonyBackend:
         assert channel.stream_type == SymphonyStreamType.ROOM
         assert channel.public is True
 
+    def test_symphony_channel_type_from_stream_type(self):
+        """Test channel_type is derived from stream_type unless passed explicitly."""
+        from chatom.base import ChannelType
+        from chatom.symphony import SymphonyChannel, SymphonyStreamType
+
+        assert SymphonyChannel(id="a", stream_type=SymphonyStreamType.IM).channel_type == ChannelType.DIRECT
+        assert SymphonyChannel(id="b", stream_type=SymphonyStreamType.MIM).channel_type == ChannelType.GROUP
+        assert SymphonyChannel(id="c", public=True).channel_type == ChannelType.PUBLIC
+        assert SymphonyChannel(id="d").channel_type == ChannelType.PRIVATE
+        assert SymphonyChannel(id="e", channel_type=ChannelType.PUBLIC).channel_type == ChannelType.PUBLIC
+
     def test_symphony_stream_types(self):
         """Test Symphony stream type enum."""
         from chatom.symphony import SymphonyStreamType
@@ -285,6 +296,207 @@ class TestSymphonyBackend:
         assert SymphonyStreamType.ROOM.value == "ROOM"
         assert SymphonyStreamType.POST.value == "POST"
 
+    def test_symphony_user_cache_ttl(self):
+        """Test cached users are refetched once past user_cache_ttl."""
+        import asyncio
+        from types import SimpleNamespace
+        from unittest.mock import AsyncMock, MagicMock
+
+        from chatom.symphony import SymphonyBackend, SymphonyConfig
+
+        backend = SymphonyBackend(config=SymphonyConfig(user_cache_ttl=60))
+        backend._bdk = MagicMock()
+        backend._user_service = MagicMock()
+        backend._user_service.get_user_detail = AsyncMock(
+            return_value=SimpleNamespace(id=123, display_name="John Doe", username="jdoe", email_address="jdoe@example.com")
+        )
+
+        first = asyncio.run(backend.fetch_user("123"))
+        assert first.name == "John Doe"
+        assert asyncio.run(backend.fetch_user("123")) is first
+        assert backend._user_service.get_user_detail.await_count == 1
+
+        backend._user_fetched_at["123"] -= 61
+        asyncio.run(backend.fetch_user("123"))
+        assert backend._user_service.get_user_detail.await_count == 2
+
+        # Users cached without a fetch time are refetched too
+        del backend._user_fetched_at["123"]
+        asyncio.run(backend.fetch_user("123"))
+        assert backend._user_service.get_user_detail.await_count == 3
+
+    def test_symphony_concurrent_channel_lookups_coalesce(self):
+        """Test concurrent lookups of one stream share a single API call and are cached."""
+        import asyncio
+        from types import SimpleNamespace
+        from unittest.mock import AsyncMock, MagicMock
+
+        from chatom.symphony import SymphonyBackend
+
+        backend = SymphonyBackend()
+        backend._stream_service = MagicMock()
+        backend._stream_service.get_stream = AsyncMock(return_value=SimpleNamespace(name="Room"))
+
+        async def lookup():
+            return await asyncio.gather(*(backend._fetch_channel_by_id("s1") for _ in range(5)))
+
+        channels = asyncio.run(lookup())
+        assert {c.name for c in channels} == {"Room"}
+        assert asyncio.run(backend._fetch_channel_by_id("s1")) is channels[0]
+        assert backend._stream_service.get_stream.await_count == 1
+        assert backend._inflight == {}
+
+    def test_symphony_message_collector(self):
+        """Test the datafeed collector filters events and queues built messages."""
+        import asyncio
+        import json
+        from types import SimpleNamespace
+        from unittest.mock import AsyncMock, MagicMock
+
+        from chatom.base import ChannelType
+        from chatom.symphony import SymphonyBackend, SymphonyStreamType
+        from chatom.symphony.backend import _MessageCollector
+
+        backend = SymphonyBackend()
+        backend._stream_service = MagicMock()
+        backend._stream_service.get_stream = AsyncMock(return_value=SimpleNamespace(name="Room"))
+        backend._user_service = MagicMock()
+        backend._user_service.get_user_detail = AsyncMock(
+            side_effect=lambda uid: SimpleNamespace(id=uid, display_name=f"User {uid}", username=f"u{uid}")
+        )
+
+        def event(stream_id, user_id, timestamp, data=None, stream_type="ROOM"):
+            message = SimpleNamespace(
+                message_id=f"m{timestamp}",
+                message="<div>hi</div>",
+                timestamp=timestamp,
+                data=data,
+                stream=SimpleNamespace(stream_id=stream_id, stream_type=stream_type),
+            )
+            initiator = SimpleNamespace(user=SimpleNamespace(user_id=user_id, display_name="", username=""))
+            return initiator, SimpleNamespace(message=message)
+
+        mention = json.dumps({"0": {"type": "com.symphony.user.mention", "id": [{"value": "3"}]}})
+
+        async def collect():
+            queue = asyncio.Queue()
+            collector = _MessageCollector(queue, "s1", "9", backend, 1000, True, True)
+            await collector.on_message_sent(*event("s1", 9, 2000))  # own message
+            await collector.on_message_sent(*event("s2", 1, 2000))  # other stream
+            await collector.on_message_sent(*event("s1", 1, 500))  # before stream start
+            await collector.on_message_sent(*event("s1", 1, 2000, data=mention))
+            return [queue.get_nowait() for _ in range(queue.qsize())]
+
+        (message,) = asyncio.run(collect())
+        assert message.id == "m2000"
+        assert message.author.name == "User 1"
+        assert message.channel.name == "Room"
+        assert [m.name for m in message.mentions] == ["User 3"]
+        # Messages carry copies, never the cached instances
+        assert message.author is not backend.users.get_by_id("1")
+        assert message.channel is not backend.channels.get_by_id("s1")
+        assert message.mentions[0] is not backend.users.get_by_id("3")
+
+        async def collect_im():
+            queue = asyncio.Queue()
+            collector = _MessageCollector(queue, None, "9", backend, 1000, True, True)
+            await collector.on_message_sent(*event("s1", 1, 3000, stream_type="IM"))
+            await collector.on_message_sent(*event("s3", 1, 3000, stream_type="IM"))
+            return [queue.get_nowait() for _ in range(queue.qsize())]
+
+        cached, uncached = asyncio.run(collect_im())
+        assert (cached.channel.name, cached.channel.channel_type) == ("Room", ChannelType.DIRECT)
+        assert backend.channels.get_by_id("s1").stream_type == SymphonyStreamType.ROOM
+        assert (uncached.channel.id, uncached.channel.stream_type) == ("s3", SymphonyStreamType.IM)
+
+        # An unresolvable sender falls back to the initiator, cached once and copied onto the message
+        backend._user_service.get_user_detail = AsyncMock(side_effect=Exception("not found"))
+
+        async def collect_unknown():
+            queue = asyncio.Queue()
+            collector = _MessageCollector(queue, None, "9", backend, 1000, True, True)
+            await collector.on_message_sent(*event("s1", 5, 4000))
+            return queue.get_nowait()
+
+        unknown = asyncio.run(collect_unknown())
+        assert unknown.author.id == "5"
+        assert backend.users.get_by_id("5") is not None
+        assert unknown.author is not backend.users.get_by_id("5")
+
+    def test_symphony_build_user_from_data(self):
+        """Test users are built alike from dict and object payloads."""
+        from types import SimpleNamespace
+
+        from chatom.symphony import SymphonyBackend
+
+        backend = SymphonyBackend()
+        from_dict = backend._build_user_from_data({"id": 1, "displayName": "One", "username": "one", "emailAddress": "one@example.com"})
+        assert (from_dict.id, from_dict.name, from_dict.email) == ("1", "One", "one@example.com")
+
+        detail = SimpleNamespace(id=2, username="two", user_attributes=SimpleNamespace(email_address="two@example.com"))
+        from_object = backend._build_user_from_data(detail)
+        assert (from_object.id, from_object.name, from_object.email) == ("2", "two", "two@example.com")
+
+        assert backend._build_user_from_data({"username": "nobody"}) is None
+
+        # Known users are reused rather than rebuilt
+        assert backend._build_user_from_data({"id": 1, "displayName": "Renamed"}) is from_dict
+
+    def test_symphony_user_ids_int(self):
+        """Test DM user IDs are converted once, de-duplicated and validated together."""
+        import pytest
+
+        from chatom.symphony import SymphonyBackend, SymphonyUser
+
+        backend = SymphonyBackend()
+        users = ["2", SymphonyUser(id="1", name="One"), "2", User(id="3")]
+        assert backend._user_ids_int(users) == [2, 1, 3]
+
+        with pytest.raises(ValueError, match="bad, worse"):
+            backend._user_ids_int(["1", "bad", "worse"])
+
+    def test_symphony_bdk_pool_size(self):
+        """Test the BDK's API clients get the configured pool size after construction."""
+        from chatom.symphony import SymphonyConfig
+        from chatom.symphony.backend import _size_bdk_pools
+
+        # Mirrors the generated ApiClient/RESTClientObject: maxsize is copied
+        # from the configuration when the client is built
+        class FakeConfiguration:
+            def __init__(self):
+                self.connection_pool_maxsize = 100
+
+        class FakeRestClient:
+            def __init__(self, configuration):
+                self.maxsize = configuration.connection_pool_maxsize
+
+        class FakeApiClient:
+            def __init__(self):
+                self.configuration = FakeConfiguration()
+                self.rest_client = FakeRestClient(self.configuration)
+
+        class FakeApiClientFactory:
+            def __init__(self):
+                self._config = object()
+                self._pod_client = FakeApiClient()
+                self._agent_client = FakeApiClient()
+                self._custom_clients = []
+
+        class FakeBdk:
+            def __init__(self):
+                self._api_client_factory = FakeApiClientFactory()
+
+        bdk = FakeBdk()
+        _size_bdk_pools(bdk, 50)
+        for client in (bdk._api_client_factory._pod_client, bdk._api_client_factory._agent_client):
+            assert client.configuration.connection_pool_maxsize == 50
+            assert client.rest_client.maxsize == 50
+
+        # Unset by default, leaving the BDK's own pool size alone
+        bdk = FakeBdk()
+        _size_bdk_pools(bdk, SymphonyConfig().http_pool_max)
+        assert bdk._api_client_factory._pod_client.rest_client.maxsize == 100
+
     def test_symphony_mention_user(self):
         """Test Symphony user mention."""
         from chatom.symphony import SymphonyUser, mention_user as symphony_mention
@@ -643,6 +855,16 @@ class TestSymphonyUserProperties:
         )
         assert "symphony" in user.avatar_url
 
+    def test_symphony_user_id_int(self):
+        """Test the cached integer user ID follows id changes."""
+        from chatom.symphony import SymphonyUser
+
+        user = SymphonyUser(id="123", name="John Doe")
+        assert user.user_id_int == 123
+        user.id = "456"
+        assert user.user_id_int == 456
+        assert SymphonyUser(id="abc", name="Bad").user_id_int is None
+
 
 class TestSlackPresenceGenericStatus:
     """Tests for Slack presence generic_status property."""
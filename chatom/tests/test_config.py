@@ -203,6 +203,7 @@ class TestSymphonyConfig:
         assert config.max_attempts == 10
         assert config.datafeed_version == "v2"
         assert config.ssl_verify is True
+        assert config.messageml_auto_wrap is True
 
     def test_pod_url_basic(self):
         """Test pod_url property with basic config."""
@@ -219,6 +220,14 @@ class TestSymphonyConfig:
         config = SymphonyConfig(host="example.symphony.com", context="/api")
         assert config.pod_url == "https://example.symphony.com/api"
 
+    def test_pod_url_follows_field_changes(self):
+        """Test the memoized pod_url is rebuilt after assignment or copy."""
+        config = SymphonyConfig(host="example.symphony.com")
+        assert config.pod_url == "https://example.symphony.com"
+        config.port = 8443
+        assert config.pod_url == "https://example.symphony.com:8443"
+        assert config.model_copy(update={"host": "other.symphony.com"}).pod_url == "https://other.symphony.com:8443"
+
     def test_bot_private_key_str_property(self):
         """Test bot_private_key_str property."""
         config = SymphonyConfig(bot_private_key_content=SecretStr("private-key-content"))
@@ -432,6 +441,21 @@ class TestSymphonyConfig:
         assert bdk_config["proxy"]["username"] == "proxy-user"
         assert bdk_config["proxy"]["password"] == "proxy-pass"
 
+    def test_to_bdk_config_reused_until_changed(self):
+        """Test to_bdk_config is built once and rebuilt after assignment or copy."""
+        config = SymphonyConfig(host="example.symphony.com", bot_username="my-bot")
+        bdk_config = config.to_bdk_config()
+        assert config.to_bdk_config() is bdk_config
+
+        config.agent_host = "agent.symphony.com"
+        updated = config.to_bdk_config()
+        assert updated is not bdk_config
+        assert updated["agent"] == {"host": "agent.symphony.com"}
+
+        copied = config.model_copy(update={"host": "other.symphony.com"})
+        assert copied.to_bdk_config()["host"] == "other.symphony.com"
+        assert config.to_bdk_config() is updated
+
     def test_pod_host_fallback_to_host(self):
         """Test that pod_host is used as fallback for host."""
         config = SymphonyConfig(pod_host="fallback.symphony.com", bot_username="bot")
@@ -455,6 +479,23 @@ class TestSymphonyConfig:
         # Config should still be created successfully
         assert config.ssl_verify is False
 
+    def test_ssl_verify_patch_applied_once(self, monkeypatch):
+        """Test repeated SSL-disabled configs do not re-wrap the BDK Configuration init."""
+        from chatom.symphony import config as config_module
+
+        class Configuration:
+            def __init__(self):
+                self.verify_ssl = True
+
+        monkeypatch.setattr(config_module, "Configuration", Configuration)
+
+        SymphonyConfig(host="example.symphony.com", ssl_verify=False)
+        patched_init = Configuration.__init__
+        SymphonyConfig(host="example.symphony.com", ssl_verify=False)
+
+        assert Configuration.__init__ is patched_init
+        assert Configuration().verify_ssl is False
+
     def test_certificate_content_creates_temp_file(self):
         """Test that certificate content creates a temp file."""
         config = SymphonyConfig(
@@ -470,6 +511,29 @@ class TestSymphonyConfig:
         config.cleanup_temp_cert()
         assert config.is_using_temp_cert is False
 
+    def test_cleanup_temp_cert_already_removed(self):
+        """Test cleanup_temp_cert clears the path when the file is already gone."""
+        config = SymphonyConfig(host="example.symphony.com", bot_certificate_content="cert")
+        os.unlink(config.bot_certificate_path)
+        config.cleanup_temp_cert()
+        assert config.is_using_temp_cert is False
+
+    def test_temp_cert_files_share_one_exit_handler(self):
+        """Test temp cert files are tracked for the module exit handler, not one handler each."""
+        from chatom.symphony.config import _cleanup_temp_cert_files, _temp_cert_paths
+
+        configs = [SymphonyConfig(host="example.symphony.com", bot_certificate_content="cert") for _ in range(3)]
+        paths = [config.bot_certificate_path for config in configs]
+        assert set(paths) <= _temp_cert_paths
+        with open(paths[0]) as f:
+            assert f.read() == "cert"
+
+        configs[0].cleanup_temp_cert()
+        assert paths[0] not in _temp_cert_paths
+
+        _cleanup_temp_cert_files()
+        assert not any(os.path.exists(path) for path in paths)
+
     def test_get_bdk_config_raises_without_symphony_bdk(self):
         """Test get_bdk_config raises ImportError when symphony-bdk not installed."""
         config = SymphonyConfig(
@@ -510,6 +574,15 @@ class TestSymphonyRoomMapper:
         assert mapper.get_room_id("Test Room") == "stream123"
         assert mapper.get_room_name("stream123") == "Test Room"
 
+    def test_register_rooms(self):
+        """Test registering several rooms at once."""
+        from chatom.symphony.config import SymphonyRoomMapper
+
+        mapper = SymphonyRoomMapper()
+        mapper.register_rooms({"Room A": "streamA", "Room B": "streamB"})
+        assert mapper.get_room_id("Room B") == "streamB"
+        assert mapper.get_room_name("streamA") == "Room A"
+
     def test_get_room_id_from_cache(self):
         """Test getting room ID from cache."""
         from chatom.symphony.config import SymphonyRoomMapper
@@ -610,3 +683,55 @@ class TestSymphonyRoomMapper:
         mapper = SymphonyRoomMapper()
         result = await mapper.get_room_name_async("unknownid")
         assert result is None
+
+    @pytest.mark.asyncio
+    async def test_get_room_id_async_coalesces_concurrent_misses(self):
+        """Test concurrent lookups of one uncached room share a single backend call."""
+        import asyncio
+        from types import SimpleNamespace
+        from typing import Any, cast
+        from unittest.mock import AsyncMock
+
+        from chatom.symphony.config import SymphonyRoomMapper
+
+        async def fetch_channel(name):
+            await asyncio.sleep(0)
+            return SimpleNamespace(id="stream789", name=name)
+
+        backend = SimpleNamespace(fetch_channel=AsyncMock(side_effect=fetch_channel))
+        mapper = SymphonyRoomMapper(backend=cast(Any, backend))
+        results = await asyncio.gather(*(mapper.get_room_id_async("Busy Room") for _ in range(5)))
+
+        assert results == ["stream789"] * 5
+        assert backend.fetch_channel.await_count == 1
+        assert mapper._inflight == {}
+        assert mapper.get_room_name("stream789") == "Busy Room"
+
+    @pytest.mark.asyncio
+    async def test_get_room_id_async_caches_search_results(self, monkeypatch):
+        """Test a room search caches unmapped returned rooms, keeping the first of duplicate names."""
+        from types import SimpleNamespace
+        from unittest.mock import AsyncMock
+
+        from chatom.symphony import config as config_module
+        from chatom.symphony.config import SymphonyRoomMapper
+
+        def room(name, room_id):
+            return SimpleNamespace(room_attributes=SimpleNamespace(name=name), room_system_info=SimpleNamespace(id=room_id))
+
+        monkeypatch.setattr(config_module, "V2RoomSearchCriteria", SimpleNamespace)
+        stream_service = SimpleNamespace(
+            search_rooms=AsyncMock(return_value=SimpleNamespace(rooms=[room("Desk", "s1"), room("Desk Ops", "s2"), room("Desk", "s3")]))
+        )
+        mapper = SymphonyRoomMapper(stream_service=stream_service)
+
+        assert await mapper.get_room_id_async("Desk") == "s1"
+        assert mapper.get_room_id("Desk Ops") == "s2"
+        assert await mapper.get_room_id_async("Missing") is None
+
+        # Rooms that are already mapped are never rebound by another room's search
+        mapper = SymphonyRoomMapper(stream_service=stream_service)
+        mapper.register_room("Desk Ops", "ops-stream")
+        assert await mapper.get_room_id_async("Desk") == "s1"
+        assert mapper.get_room_id("Desk Ops") == "ops-stream"
+        assert mapper.get_room_name("s2") is None
@@ -267,15 +267,46 @@ class TestMockSymphonyBackend:
 
         assert "Edited" in edited.content
         assert len(backend.edited_messages) == 1
+        assert backend.mock_messages["stream123"][0]["content"] == "<messageML>Edited</messageML>"
 
     @pytest.mark.asyncio
     async def test_delete_message(self, backend):
         """Test deleting (suppressing) messages."""
         await backend.connect()
         msg_id = backend.add_mock_message("stream123", 123456, "<messageML>Delete me</messageML>")
+        kept_id = backend.add_mock_message("stream123", 123456, "<messageML>Keep me</messageML>")
 
         await backend.delete_message(message=msg_id, channel="stream123")
         assert msg_id in backend.deleted_messages
+        assert [m["message_id"] for m in backend.mock_messages["stream123"]] == [kept_id]
+        assert msg_id not in backend.mock_messages_by_id["stream123"]
+
+    @pytest.mark.asyncio
+    async def test_edit_and_delete_unindexed_message(self, backend):
+        """Test edit and delete find messages written straight into mock_messages."""
+        from datetime import datetime, timezone
+
+        await backend.connect()
+        backend.mock_messages["stream123"] = [
+            {"message_id": "direct", "user_id": 456, "content": "Original", "timestamp": datetime.now(timezone.utc)},
+        ]
+
+        await backend.edit_message(message="direct", content="Edited", channel="stream123")
+        assert backend.mock_messages["stream123"][0]["content"] == "Edited"
+
+        await backend.delete_message(message="direct", channel="stream123")
+        assert backend.mock_messages["stream123"] == []
+
+    @pytest.mark.asyncio
+    async def test_edit_message_replaced_directly(self, backend):
+        """Test edit updates the stored message when the indexed one was replaced directly."""
+        await backend.connect()
+        msg_id = backend.add_mock_message("stream123", 456, "Original")
+        replacement = dict(backend.mock_messages["stream123"][0])
+        backend.mock_messages["stream123"] = [replacement]
+
+        await backend.edit_message(message=msg_id, content="Edited", channel="stream123")
+        assert replacement["content"] == "Edited"
 
     @pytest.mark.asyncio
     async def test_presence(self, backend):
@@ -1401,6 +1432,86 @@ class TestMockSymphonyBackendCoverage:
         user = await backend.fetch_user("999999")
         assert user is None
 
+    @pytest.mark.asyncio
+    async def test_fetch_user_by_email_name_and_handle(self, backend):
+        """Test fetch_user lookups by email, name and handle, including a replaced user."""
+        await backend.connect()
+        backend.add_mock_user(1, "Alice Smith", "alice", "alice@example.com")
+        backend.add_mock_user(2, "Bob Jones", "bob")
+
+        assert (await backend.fetch_user(email="bob@example.com")).id == "2"
+        assert (await backend.fetch_user(name="alice smith")).id == "1"
+        assert (await backend.fetch_user(handle="BOB")).id == "2"
+        assert await backend.fetch_user(email="nobody@example.com") is None
+
+        backend.add_mock_user(2, "Robert Jones", "rob")
+        assert await backend.fetch_user(handle="bob") is None
+        assert backend.mock_users_by_name_lower["rob"] == "2"
+
+    @pytest.mark.asyncio
+    async def test_fetch_user_shared_name_after_replace(self, backend):
+        """Test replacing a user keeps another user with the same name findable."""
+        await backend.connect()
+        backend.add_mock_user(1, "Bob", "bob1")
+        backend.add_mock_user(2, "Bob", "bob2")
+        backend.add_mock_user(1, "Alice", "alice")
+
+        assert (await backend.fetch_user(name="Bob")).id == "2"
+        assert (await backend.fetch_user(name="Alice")).id == "1"
+        assert await backend.fetch_user(handle="bob1") is None
+
+    @pytest.mark.asyncio
+    async def test_fetch_user_written_directly(self, backend):
+        """Test users written straight into mock_users are found by email, name and handle."""
+        await backend.connect()
+        backend.mock_users["7"] = {"id": 7, "display_name": "Direct User", "username": "direct", "email": "direct@example.com"}
+        backend.add_mock_user(8, "Other", "other")
+        backend.mock_users["8"] = {"id": 8, "display_name": "Renamed", "username": "renamed", "email": "renamed@example.com"}
+
+        assert (await backend.fetch_user(email="direct@example.com")).id == "7"
+        assert (await backend.fetch_user(name="direct user")).id == "7"
+        assert (await backend.fetch_user(handle="DIRECT")).id == "7"
+        assert (await backend.fetch_user(handle="renamed")).id == "8"
+        assert await backend.fetch_user(name="Other") is None
+        assert await backend.fetch_user(email="other@example.com") is None
+
+    @pytest.mark.asyncio
+    async def test_fetch_channel_by_name(self, backend):
+        """Test fetch_channel name lookups, including a replaced stream."""
+        await backend.connect()
+        backend.add_mock_stream("stream1", "General")
+        backend.add_mock_stream("stream2", "Random")
+
+        assert (await backend.fetch_channel(name="general")).id == "stream1"
+        assert await backend.fetch_channel(name="missing") is None
+
+        backend.add_mock_stream("stream2", "Trading")
+        assert await backend.fetch_channel(name="random") is None
+        assert (await backend.fetch_channel(name="TRADING")).id == "stream2"
+
+    @pytest.mark.asyncio
+    async def test_fetch_channel_written_directly(self, backend):
+        """Test streams written straight into mock_streams are found by name."""
+        await backend.connect()
+        backend.mock_streams["direct"] = {"id": "direct", "name": "Direct Room", "type": "ROOM"}
+        backend.add_mock_stream("stream1", "General")
+        backend.mock_streams["stream1"] = {"id": "stream1", "name": "Renamed", "type": "ROOM"}
+
+        assert (await backend.fetch_channel(name="direct room")).id == "direct"
+        assert (await backend.fetch_channel(name="RENAMED")).id == "stream1"
+        assert await backend.fetch_channel(name="General") is None
+
+    @pytest.mark.asyncio
+    async def test_fetch_channel_shared_name_after_replace(self, backend):
+        """Test replacing a stream keeps another stream with the same name findable."""
+        await backend.connect()
+        backend.add_mock_stream("s1", "Desk")
+        backend.add_mock_stream("s2", "Desk")
+        backend.add_mock_stream("s1", "Ops")
+
+        assert (await backend.fetch_channel(name="desk")).id == "s2"
+        assert (await backend.fetch_channel(name="ops")).id == "s1"
+
     @pytest.mark.asyncio
     async def test_fetch_channel_from_cache(self, backend):
         """Test fetch_channel checks cache first."""
@@ -1456,6 +1567,51 @@ class TestMockSymphonyBackendCoverage:
         assert len(messages) == 1
         assert messages[0].content == "New message"
 
+    @pytest.mark.asyncio
+    async def test_fetch_messages_out_of_order_window(self, backend):
+        """Test fetch_messages orders, filters and limits messages added out of order."""
+        from datetime import datetime, timezone
+
+        await backend.connect()
+        for year in (2021, 2019, 2023, 2020, 2022):
+            backend.add_mock_message("stream123", 456, str(year), timestamp=datetime(year, 1, 1, tzinfo=timezone.utc))
+
+        after_ts = str(int(datetime(2020, 1, 1, tzinfo=timezone.utc).timestamp() * 1000))
+        before_ts = str(int(datetime(2023, 1, 1, tzinfo=timezone.utc).timestamp() * 1000))
+        messages = await backend.fetch_messages("stream123", limit=2, before=before_ts, after=after_ts)
+        assert [m.content for m in messages] == ["2022", "2021"]
+
+        messages = await backend.fetch_messages("stream123")
+        assert [m.content for m in messages] == ["2023", "2022", "2021", "2020", "2019"]
+
+    @pytest.mark.asyncio
+    async def test_fetch_messages_equal_timestamps(self, backend):
+        """Test messages sharing a timestamp come back in the order they were stored."""
+        from datetime import datetime, timezone
+
+        await backend.connect()
+        ts = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        for i in range(3):
+            backend.add_mock_message("stream123", 456, f"m{i}", message_id=f"m{i}", timestamp=ts)
+
+        messages = await backend.fetch_messages("stream123", limit=2)
+        assert [m.id for m in messages] == ["m0", "m1"]
+
+        # Messages written straight into the public store are still ordered by time
+        backend.mock_messages["stream123"].append(
+            {"message_id": "old", "user_id": 456, "content": "old", "timestamp": datetime(2020, 1, 1, tzinfo=timezone.utc)}
+        )
+        messages = await backend.fetch_messages("stream123")
+        assert [m.id for m in messages] == ["m0", "m1", "m2", "old"]
+        # Fetching never reorders the public store
+        assert [m["message_id"] for m in backend.mock_messages["stream123"]] == ["m0", "m1", "m2", "old"]
+
+        # Stored messages are inserted in time order, after any sharing their timestamp
+        backend.mock_messages["stream123"].pop()
+        backend.add_mock_message("stream123", 456, "m3", message_id="m3", timestamp=ts)
+        backend.add_mock_message("stream123", 456, "early", message_id="early", timestamp=datetime(2020, 1, 1, tzinfo=timezone.utc))
+        assert [m["message_id"] for m in backend.mock_messages["stream123"]] == ["early", "m0", "m1", "m2", "m3"]
+
     @pytest.mark.asyncio
     async def test_send_message_with_data_and_attachments(self, backend):
         """Test send_message with data and attachments kwargs."""
@@ -35,7 +35,7 @@ def _ms(dt: datetime) -> int:
 @pytest.fixture
 def backend():
     """Create a SymphonyBackend with mocked internals."""
-    b = object.__new__(SymphonyBackend)
+    b = SymphonyBackend()
     b._bdk = MagicMock()
     b._bot_user_id_int = 9999
     b._stream_cache = {}
@@ -49,6 +49,7 @@ def mock_list_messages(backend):
     msg_service = MagicMock()
     msg_service.list_messages = AsyncMock()
     backend._bdk.messages.return_value = msg_service
+    backend._message_service = msg_service
     return msg_service.list_messages
 
 
@@ -220,6 +221,44 @@ class TestFetchRecentMessages:
         # Should have used skip pagination (at least 2 calls for 800 messages)
         assert mock_list_messages.call_count >= 2
 
+    def test_window_pages_fetched_concurrently(self, backend, mock_list_messages):
+        """After a full first page, later pages are requested together and kept in order."""
+        now = datetime.now(timezone.utc)
+        all_messages = _make_messages_in_range(
+            _ms(now - timedelta(minutes=30)),
+            _ms(now - timedelta(minutes=1)),
+            1100,
+        )
+        mock_list_messages.side_effect = _make_side_effect(all_messages)
+
+        result = asyncio.run(backend._fetch_message_window("stream123", _ms(now - timedelta(hours=1)), 500))
+
+        assert [m.message_id for m in result] == [m.message_id for m in all_messages]
+        skips = [c.kwargs["skip"] for c in mock_list_messages.call_args_list]
+        assert skips == [0, 500, 1000, 1500, 2000]
+
+
+class TestConvertMessages:
+    """Test _convert_messages model building."""
+
+    def test_channel_and_authors_not_shared_within_batch(self, backend):
+        """Each message gets its own channel and author, so edits do not leak across messages."""
+        raw = [_make_v4_message("a", 1000, user_id=1), _make_v4_message("b", 2000, user_id=2), _make_v4_message("c", 3000, user_id=1)]
+
+        result = backend._convert_messages(raw, "stream123")
+
+        assert [m.author.id for m in result] == ["1", "2", "1"]
+        assert result[0].author is not result[2].author
+        assert result[0].channel is not result[1].channel
+        assert result[0].channel.id == "stream123"
+
+        result[0].channel.name = "renamed"
+        result[0].author.name = "renamed"
+        assert result[1].channel.name != "renamed"
+        assert result[2].author.name != "renamed"
+        result[0].author.roles.append("admin")
+        assert result[2].author.roles == []
+
 
 class TestFetchMessagesSince:
     """Test _fetch_messages_since (the after= parameter path)."""